@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN
-from .coordinator import GeekMagicCoordinator
+from .const import DOMAIN, SETUP_TIMEOUT
+from .coordinator import GeekMagicConfigEntry, GeekMagicCoordinator
 from .device import GeekMagicDevice
 from .panel import async_register_panel
 from .store import GeekMagicStore
@@ -44,12 +46,12 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     _LOGGER.debug("Setting up GeekMagic domain")
 
     # Initialize domain data
-    hass.data.setdefault(DOMAIN, {})
+    domain_data = hass.data.setdefault(DOMAIN, {})
 
     # Initialize global store for views
     store = GeekMagicStore(hass)
     await store.async_load()
-    hass.data[DOMAIN]["store"] = store
+    domain_data["store"] = store
 
     # Register WebSocket commands
     async_register_websocket_commands(hass)
@@ -61,7 +63,7 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     return True
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: GeekMagicConfigEntry) -> bool:
     """Set up GeekMagic from a config entry.
 
     Args:
@@ -71,18 +73,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     Returns:
         True if setup successful
     """
-    # Ensure domain is set up
-    if DOMAIN not in hass.data:
-        await async_setup(hass, {})
-
     host = entry.data[CONF_HOST]
     _LOGGER.debug("Setting up GeekMagic integration for %s", host)
 
     session = async_get_clientsession(hass)
     device = GeekMagicDevice(host, session=session)
 
-    # Test connection
-    if not await device.test_connection():
+    # Test connection. The shared HA session has no short timeout, so bound it
+    # here and let HA retry setup with backoff rather than block startup.
+    try:
+        async with asyncio.timeout(SETUP_TIMEOUT):
+            connected = await device.test_connection()
+    except TimeoutError as err:
+        raise ConfigEntryNotReady(f"Timed out connecting to GeekMagic device at {host}") from err
+
+    if not connected:
         _LOGGER.error("Could not connect to GeekMagic device at %s", host)
         return False
 
@@ -92,7 +97,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = GeekMagicCoordinator(
         hass=hass,
         device=device,
-        options=dict(entry.options),
+        options=entry.options,
         config_entry=entry,
     )
 
@@ -100,9 +105,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.debug("Performing first refresh for %s", host)
     await coordinator.async_config_entry_first_refresh()
 
-    # Store coordinator
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    entry.runtime_data = coordinator
 
     # Set up options update listener
     entry.async_on_unload(entry.add_update_listener(async_options_update_listener))
@@ -114,7 +117,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: GeekMagicConfigEntry) -> bool:
     """Unload a config entry.
 
     Args:
@@ -127,18 +130,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     host = entry.data.get(CONF_HOST, "unknown")
     _LOGGER.debug("Unloading GeekMagic integration for %s", host)
 
-    # Unload platforms
+    # Unload platforms (runtime_data is released along with the entry)
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-
-    # Remove coordinator
-    if unload_ok and entry.entry_id in hass.data.get(DOMAIN, {}):
-        del hass.data[DOMAIN][entry.entry_id]
+    if unload_ok:
         _LOGGER.debug("GeekMagic integration unloaded for %s", host)
 
     return unload_ok
 
 
-async def async_options_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+async def async_options_update_listener(hass: HomeAssistant, entry: GeekMagicConfigEntry) -> None:
     """Handle options update.
 
     Args:
@@ -147,8 +147,8 @@ async def async_options_update_listener(hass: HomeAssistant, entry: ConfigEntry)
     """
     host = entry.data.get(CONF_HOST, "unknown")
     _LOGGER.debug("Options updated for GeekMagic device %s", host)
-    coordinator: GeekMagicCoordinator = hass.data[DOMAIN][entry.entry_id]
-    coordinator.update_options(dict(entry.options))
+    coordinator = entry.runtime_data
+    coordinator.update_options(entry.options)
     # Trigger immediate refresh so device displays updated config
     await coordinator.async_request_refresh()
 
@@ -10,6 +10,7 @@ DISPLAY_HEIGHT = 240
 DEFAULT_REFRESH_INTERVAL = 10  # seconds
 DEFAULT_JPEG_QUALITY = 92  # High quality for crisp display
 MAX_IMAGE_SIZE = 400 * 1024  # 400KB max size for device uploads
+SETUP_TIMEOUT = 10  # seconds to wait for the device during entry setup
 
 # Config keys
 CONF_HOST = "host"
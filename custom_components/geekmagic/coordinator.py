@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, cast
 
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import __version__ as ha_version
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
@@ -73,6 +76,8 @@ from .widgets.theme import get_theme
 from .widgets.weather import WeatherWidget
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
     from .layouts.base import Layout
     from .store import GeekMagicStore
 
@@ -171,7 +176,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         self,
         hass: HomeAssistant,
         device: GeekMagicDevice,
-        options: dict[str, Any],
+        options: Mapping[str, Any],
         config_entry: Any = None,
     ) -> None:
         """Initialize the coordinator.
@@ -179,13 +184,15 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         Args:
             hass: Home Assistant instance
             device: GeekMagic device client
-            options: Integration options
+            options: Integration options (read-only, not copied)
             config_entry: Config entry reference for entity registration
         """
         self.device = device
         self.options = self._migrate_options(options)
         self.renderer = Renderer()
+        self._render_lock = threading.Lock()
         self._layouts: list = []  # List of layouts for each screen
+        self._screen_names: list[str] = []  # Display name for each layout
         self._current_screen: int = 0
         self._last_screen_change: float = time.time()
         self._last_image: bytes | None = None  # PNG bytes for camera preview
@@ -194,7 +201,8 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         self.config_entry = config_entry
         self._camera_images: dict[str, bytes] = {}  # Pre-fetched camera images
         self._update_preview: bool = True  # Update preview on next refresh
-        self._preview_just_updated: bool = False  # True if preview was updated in last refresh
+        # Called only when the preview image changes, not on every poll
+        self._preview_listeners: list[Callable[[], None]] = []
 
         # Device state (updated on refresh)
         self._device_state: DeviceState | None = None
@@ -222,10 +230,11 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         # Initialize screens
         self._setup_screens()
 
-        # Create welcome layout for when no screens are configured
+        # Welcome layout for when no screens are configured, built on first use
         self._welcome_layout: Layout | None = None
+        self._welcome_entity_count: TextWidget | None = None
 
-    def _migrate_options(self, options: dict[str, Any]) -> dict[str, Any]:
+    def _migrate_options(self, options: Mapping[str, Any]) -> Mapping[str, Any]:
         """Migrate old single-screen options to new multi-screen format.
 
         Args:
@@ -258,6 +267,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         - Legacy format: screens list with inline config (for backward compatibility)
         """
         self._layouts = []
+        self._screen_names = []
 
         # Check for new format first (global views)
         assigned_views = self.options.get(CONF_ASSIGNED_VIEWS, [])
@@ -298,6 +308,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             view_name = view_config.get("name", f"View {i + 1}")
             layout = self._create_layout(view_config)
             self._layouts.append(layout)
+            self._screen_names.append(view_name)
             _LOGGER.debug(
                 "Created view %d '%s' with layout %s (%d slots)",
                 i,
@@ -315,6 +326,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             screen_name = screen_config.get("name", f"Screen {i + 1}")
             layout = self._create_layout(screen_config)
             self._layouts.append(layout)
+            self._screen_names.append(screen_name)
             _LOGGER.debug(
                 "Created screen %d '%s' with layout %s (%d slots)",
                 i,
@@ -381,6 +393,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             )
         )
         layout.set_widget(2, entity_count)
+        self._welcome_entity_count = entity_count
 
         # Footer slot 3: Setup hint
         setup_hint = TextWidget(
@@ -406,7 +419,7 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
     def _get_entity_count(self) -> int:
         """Get total number of entities in Home Assistant."""
         try:
-            return len(self.hass.states.async_all())
+            return self.hass.states.async_entity_ids_count()
         except Exception:
             return 0
 
@@ -480,22 +493,12 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
 
     @property
     def current_screen_name(self) -> str:
-        """Get current screen name."""
-        # Check for new format first
-        assigned_views = self.options.get(CONF_ASSIGNED_VIEWS, [])
-        if assigned_views:
-            if 0 <= self._current_screen < len(assigned_views):
-                store = self._get_store()
-                if store:
-                    view = store.get_view(assigned_views[self._current_screen])
-                    if view:
-                        return view.get("name", f"View {self._current_screen + 1}")
-            return "Unknown"
-
-        # Legacy format
-        screens = self.options.get(CONF_SCREENS, [])
-        if 0 <= self._current_screen < len(screens):
-            return screens[self._current_screen].get("name", f"Screen {self._current_screen + 1}")
+        """Get current screen name.
+
+        Names are resolved once in _setup_screens() alongside the layouts.
+        """
+        if 0 <= self._current_screen < len(self._screen_names):
+            return self._screen_names[self._current_screen]
         return "Unknown"
 
     async def async_set_screen(self, screen_index: int) -> None:
@@ -507,6 +510,8 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         if 0 <= screen_index < len(self._layouts):
             self._current_screen = screen_index
             self._last_screen_change = time.time()
+            # Show the new screen in HA right away; the refresh may be debounced
+            self.async_update_listeners()
             await self.async_request_refresh()
 
     async def async_next_screen(self) -> None:
@@ -521,11 +526,11 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             prev_screen = (self._current_screen - 1) % len(self._layouts)
             await self.async_set_screen(prev_screen)
 
-    def update_options(self, options: dict[str, Any]) -> None:
+    def update_options(self, options: Mapping[str, Any]) -> None:
         """Update coordinator options.
 
         Args:
-            options: New options dictionary
+            options: New options mapping (read-only, not copied)
         """
         self.options = self._migrate_options(options)
 
@@ -545,30 +550,33 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         Returns:
             Tuple of (jpeg_data, png_data)
         """
-        # Create canvas
-        img, draw = self.renderer.create_canvas()
-
-        # Render current screen's layout
-        if self._layouts and 0 <= self._current_screen < len(self._layouts):
-            layout = self._layouts[self._current_screen]
-            _LOGGER.debug(
-                "Rendering layout %s with %d widgets",
-                type(layout).__name__,
-                sum(1 for s in layout.slots if s.widget is not None),
-            )
-            layout.render(self.renderer, draw, self.hass)
-        else:
-            # No screens configured - show welcome screen with live data
-            _LOGGER.debug("No screens configured, rendering welcome screen")
-            # Recreate welcome layout each time to get fresh HA stats
-            welcome_layout = self._create_welcome_layout()
-            welcome_layout.render(self.renderer, draw, self.hass)
-
-        # Encode to both formats
-        jpeg_data = self.renderer.to_jpeg(img)
-        png_data = self.renderer.to_png(img)
-
-        return jpeg_data, png_data
+        # Overlapping refreshes (e.g. a button press during a periodic update)
+        # would otherwise draw into the same reused canvas from two threads
+        with self._render_lock:
+            # Reuse the renderer's canvas rather than allocating one per frame
+            img, draw = self.renderer.create_canvas(reuse=True)
+
+            # Render current screen's layout
+            if self._layouts and 0 <= self._current_screen < len(self._layouts):
+                layout = self._layouts[self._current_screen]
+                _LOGGER.debug(
+                    "Rendering layout %s with %d widgets",
+                    type(layout).__name__,
+                    sum(1 for s in layout.slots if s.widget is not None),
+                )
+                layout.render(self.renderer, draw, self.hass)
+            else:
+                # No screens configured - show welcome screen with live data
+                _LOGGER.debug("No screens configured, rendering welcome screen")
+                # Build the welcome layout once; only the entity count changes between renders
+                if self._welcome_layout is None:
+                    self._welcome_layout = self._create_welcome_layout()
+                elif self._welcome_entity_count is not None:
+                    self._welcome_entity_count.text = str(self._get_entity_count())
+                self._welcome_layout.render(self.renderer, draw, self.hass)
+
+            # Encode to both formats
+            return self.renderer.to_jpeg_and_png(img)
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data and update display.
@@ -620,9 +628,12 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             except Exception as e:
                 _LOGGER.debug("Failed to fetch device state: %s", e)
 
-            # Pre-fetch camera images and chart history (must be done in async context)
-            await self._async_fetch_camera_images()
-            await self._async_fetch_chart_history()
+            # Pre-fetch camera images and chart history (must be done in async context).
+            # They are independent, so overlap the camera and recorder waits.
+            await asyncio.gather(
+                self._async_fetch_camera_images(),
+                self._async_fetch_chart_history(),
+            )
 
             # Render image in executor to avoid blocking the event loop
             # (Pillow image operations are CPU-intensive)
@@ -630,10 +641,11 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
 
             # Only update preview image on config changes or manual refresh
             # (prevents HA UI from refreshing during periodic updates)
-            self._preview_just_updated = self._update_preview
             if self._update_preview:
                 self._last_image = png_data
                 self._update_preview = False
+                for listener in self._preview_listeners:
+                    listener()
 
             _LOGGER.debug(
                 "Rendered image: JPEG=%d bytes, PNG=%d bytes",
@@ -670,10 +682,22 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         """Get the last rendered image as PNG bytes."""
         return self._last_image
 
-    @property
-    def preview_just_updated(self) -> bool:
-        """Check if preview was updated in the last refresh cycle."""
-        return self._preview_just_updated
+    @callback
+    def async_add_preview_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Add a listener called when the preview image is re-rendered.
+
+        Args:
+            listener: Callback to invoke after last_image changes
+
+        Returns:
+            Function to remove the listener
+        """
+        self._preview_listeners.append(listener)
+
+        def remove_listener() -> None:
+            self._preview_listeners.remove(listener)
+
+        return remove_listener
 
     @property
     def device_name(self) -> str:
@@ -748,6 +772,9 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
             brightness: Brightness level 0-100
         """
         await self.device.set_brightness(brightness)
+        # Apply optimistically; the periodic brightness poll reconciles it
+        self._device_brightness = brightness
+        self.async_update_listeners()
 
     async def async_refresh_display(self) -> None:
         """Force an immediate display refresh."""
@@ -769,18 +796,25 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
         This must be called from the async context before rendering,
         since camera.async_get_image() is async.
         """
-        from homeassistant.components.camera import async_get_image
-
         # Find all camera widgets in current layout
         camera_entity_ids: set[str] = set()
 
         if self._layouts and 0 <= self._current_screen < len(self._layouts):
             layout = self._layouts[self._current_screen]
-            for slot in layout.slots:
-                if slot.widget and isinstance(slot.widget, CameraWidget):
-                    entity_id = slot.widget.config.entity_id
-                    if entity_id:
-                        camera_entity_ids.add(entity_id)
+            camera_entity_ids = {
+                widget.config.entity_id
+                for widget in layout.get_widgets_of_type(CameraWidget)
+                if widget.config.entity_id
+            }
+
+        # Drop snapshots for cameras no longer on screen so they don't accumulate
+        for entity_id in self._camera_images.keys() - camera_entity_ids:
+            del self._camera_images[entity_id]
+
+        if not camera_entity_ids:
+            return
+
+        from homeassistant.components.camera import async_get_image
 
         # Fetch images for each camera
         for entity_id in camera_entity_ids:
@@ -847,11 +881,10 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
 
         if self._layouts and 0 <= self._current_screen < len(self._layouts):
             layout = self._layouts[self._current_screen]
-            for slot in layout.slots:
-                if slot.widget and isinstance(slot.widget, ChartWidget):
-                    entity_id = slot.widget.config.entity_id
-                    if entity_id:
-                        chart_widgets.append((entity_id, slot.widget))
+            for widget in layout.get_widgets_of_type(ChartWidget):
+                entity_id = widget.config.entity_id
+                if entity_id:
+                    chart_widgets.append((entity_id, widget))
 
         if not chart_widgets:
             return
@@ -906,3 +939,22 @@ class GeekMagicCoordinator(DataUpdateCoordinator):
                     _LOGGER.debug("No history returned for %s", entity_id)
             except Exception as e:
                 _LOGGER.warning("Failed to fetch history for %s: %s", entity_id, e)
+
+
+type GeekMagicConfigEntry = ConfigEntry[GeekMagicCoordinator]
+
+
+def get_loaded_coordinators(hass: HomeAssistant) -> list[GeekMagicCoordinator]:
+    """Get coordinators for all loaded GeekMagic config entries.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        List of coordinators, one per loaded device
+    """
+    return [
+        entry.runtime_data
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state is ConfigEntryState.LOADED
+    ]
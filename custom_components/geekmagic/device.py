@@ -14,7 +14,7 @@ _LOGGER = logging.getLogger(__name__)
 TIMEOUT = aiohttp.ClientTimeout(total=30)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionResult:
     """Result of a connection test."""
 
@@ -29,7 +29,7 @@ class ConnectionResult:
         return self.success
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceState:
     """Represents the current device state."""
 
@@ -38,7 +38,7 @@ class DeviceState:
     current_image: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class SpaceInfo:
     """Represents device storage info."""
 
@@ -27,13 +27,9 @@ class GeekMagicEntity(CoordinatorEntity["GeekMagicCoordinator"]):
         """
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.entry.entry_id}_{entity_suffix}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.entry.entry_id)},
-            name=self.coordinator.entry.title,
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, coordinator.entry.entry_id)},
+            name=coordinator.entry.title,
             manufacturer="GeekMagic",
             model="SmallTV Pro",
         )
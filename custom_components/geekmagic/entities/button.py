@@ -3,79 +3,82 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from homeassistant.components.button import ButtonEntity
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from ..const import DOMAIN
 from .base import GeekMagicEntity
 
 if TYPE_CHECKING:
-    from ..coordinator import GeekMagicCoordinator
+    from collections.abc import Awaitable, Callable
 
-_LOGGER = logging.getLogger(__name__)
-
-
-async def async_setup_entry(
-    hass: HomeAssistant,
-    entry: ConfigEntry,
-    async_add_entities: AddEntitiesCallback,
-) -> None:
-    """Set up GeekMagic button entities."""
-    coordinator: GeekMagicCoordinator = hass.data[DOMAIN][entry.entry_id]
-
-    entities = [
-        GeekMagicRefreshButton(coordinator),
-        GeekMagicNextScreenButton(coordinator),
-        GeekMagicPreviousScreenButton(coordinator),
-    ]
-
-    async_add_entities(entities)
+    from ..coordinator import GeekMagicConfigEntry, GeekMagicCoordinator
 
+_LOGGER = logging.getLogger(__name__)
 
-class GeekMagicRefreshButton(GeekMagicEntity, ButtonEntity):
-    """Button to force display refresh."""
 
-    _attr_name = "Refresh Display"
-    _attr_icon = "mdi:refresh"
+@dataclass(frozen=True, kw_only=True)
+class GeekMagicButtonEntityDescription(ButtonEntityDescription):
+    """Describes a GeekMagic button and the coordinator action it triggers."""
 
-    def __init__(self, coordinator: GeekMagicCoordinator) -> None:
-        """Initialize refresh button."""
-        super().__init__(coordinator, "refresh")
+    press_fn: Callable[[GeekMagicCoordinator], Awaitable[None]]
 
-    async def async_press(self) -> None:
-        """Handle button press."""
-        await self.coordinator.async_refresh_display()
 
+DEVICE_BUTTONS: tuple[GeekMagicButtonEntityDescription, ...] = (
+    GeekMagicButtonEntityDescription(
+        key="refresh",
+        name="Refresh Display",
+        icon="mdi:refresh",
+        press_fn=lambda c: c.async_refresh_display(),
+    ),
+    GeekMagicButtonEntityDescription(
+        key="next_screen",
+        name="Next Screen",
+        icon="mdi:skip-next",
+        press_fn=lambda c: c.async_next_screen(),
+    ),
+    GeekMagicButtonEntityDescription(
+        key="previous_screen",
+        name="Previous Screen",
+        icon="mdi:skip-previous",
+        press_fn=lambda c: c.async_previous_screen(),
+    ),
+)
 
-class GeekMagicNextScreenButton(GeekMagicEntity, ButtonEntity):
-    """Button to switch to next screen."""
 
-    _attr_name = "Next Screen"
-    _attr_icon = "mdi:skip-next"
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: GeekMagicConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up GeekMagic button entities."""
+    coordinator = entry.runtime_data
 
-    def __init__(self, coordinator: GeekMagicCoordinator) -> None:
-        """Initialize next screen button."""
-        super().__init__(coordinator, "next_screen")
+    async_add_entities(GeekMagicButton(coordinator, description) for description in DEVICE_BUTTONS)
 
-    async def async_press(self) -> None:
-        """Handle button press."""
-        await self.coordinator.async_next_screen()
 
+class GeekMagicButton(GeekMagicEntity, ButtonEntity):
+    """Button whose press runs a coordinator action via its description."""
 
-class GeekMagicPreviousScreenButton(GeekMagicEntity, ButtonEntity):
-    """Button to switch to previous screen."""
+    entity_description: GeekMagicButtonEntityDescription
 
-    _attr_name = "Previous Screen"
-    _attr_icon = "mdi:skip-previous"
+    def __init__(
+        self,
+        coordinator: GeekMagicCoordinator,
+        description: GeekMagicButtonEntityDescription,
+    ) -> None:
+        """Initialize button.
 
-    def __init__(self, coordinator: GeekMagicCoordinator) -> None:
-        """Initialize previous screen button."""
-        super().__init__(coordinator, "previous_screen")
+        Args:
+            coordinator: The data coordinator
+            description: Button description
+        """
+        super().__init__(coordinator, description.key)
+        self.entity_description = description
 
     async def async_press(self) -> None:
         """Handle button press."""
-        await self.coordinator.async_previous_screen()
+        await self.entity_description.press_fn(self.coordinator)
@@ -6,26 +6,24 @@ import logging
 from typing import TYPE_CHECKING
 
 from homeassistant.components.number import NumberEntity, NumberMode
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from ..const import DOMAIN
 from .base import GeekMagicEntity
 
 if TYPE_CHECKING:
-    from ..coordinator import GeekMagicCoordinator
+    from ..coordinator import GeekMagicConfigEntry, GeekMagicCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: GeekMagicConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up GeekMagic number entities."""
-    coordinator: GeekMagicCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     entities = [
         GeekMagicBrightnessNumber(coordinator),
@@ -57,11 +55,7 @@ class GeekMagicBrightnessNumber(GeekMagicEntity, NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Set brightness."""
-        brightness = int(value)
-        await self.coordinator.device.set_brightness(brightness)
-        # Update local cache immediately so UI reflects change
-        self.coordinator.device_brightness = brightness
-        self.async_write_ha_state()
+        await self.coordinator.async_set_brightness(int(value))
 
 
 class GeekMagicRefreshIntervalNumber(GeekMagicEntity, NumberEntity):
@@ -6,15 +6,13 @@ import logging
 from typing import TYPE_CHECKING
 
 from homeassistant.components.select import SelectEntity
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from ..const import DOMAIN
 from .base import GeekMagicEntity
 
 if TYPE_CHECKING:
-    from ..coordinator import GeekMagicCoordinator
+    from ..coordinator import GeekMagicConfigEntry, GeekMagicCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,15 +23,25 @@ DEVICE_MODES = {
     "weather": "Weather",
     "system": "System Info",
 }
+MODE_OPTIONS = list(DEVICE_MODES.values())
+
+# Device theme number <-> mode label (theme 3 is custom image mode, used by this integration)
+THEME_TO_MODE: dict[int, str] = {
+    3: DEVICE_MODES["custom"],
+    0: DEVICE_MODES["clock"],
+    1: DEVICE_MODES["weather"],
+    2: DEVICE_MODES["system"],
+}
+MODE_TO_THEME: dict[str, int] = {mode: theme for theme, mode in THEME_TO_MODE.items()}
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: GeekMagicConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up GeekMagic select entities."""
-    coordinator: GeekMagicCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     entities = [
         GeekMagicModeSelect(coordinator),
@@ -56,33 +64,18 @@ class GeekMagicModeSelect(GeekMagicEntity, SelectEntity):
     @property
     def options(self) -> list[str]:
         """Return available modes."""
-        return list(DEVICE_MODES.values())
+        return MODE_OPTIONS
 
     @property
     def current_option(self) -> str | None:
         """Return current mode."""
         if self.coordinator.device_state:
-            theme = self.coordinator.device_state.theme
-            # Theme 3 = custom image mode (our integration)
-            if theme == 3:
-                return DEVICE_MODES["custom"]
-            if theme == 0:
-                return DEVICE_MODES["clock"]
-            if theme == 1:
-                return DEVICE_MODES["weather"]
-            if theme == 2:
-                return DEVICE_MODES["system"]
+            return THEME_TO_MODE.get(self.coordinator.device_state.theme, DEVICE_MODES["custom"])
         return DEVICE_MODES["custom"]
 
     async def async_select_option(self, option: str) -> None:
         """Select a mode."""
-        theme_map = {
-            DEVICE_MODES["custom"]: 3,
-            DEVICE_MODES["clock"]: 0,
-            DEVICE_MODES["weather"]: 1,
-            DEVICE_MODES["system"]: 2,
-        }
-        theme = theme_map.get(option, 3)
+        theme = MODE_TO_THEME.get(option, 3)
         await self.coordinator.device.set_theme(theme)
         await self.coordinator.async_request_refresh()
 
@@ -96,6 +89,22 @@ class GeekMagicCurrentViewSelect(GeekMagicEntity, SelectEntity):
     def __init__(self, coordinator: GeekMagicCoordinator) -> None:
         """Initialize current view select."""
         super().__init__(coordinator, "current_view")
+        # View names only change when assignments or the view store change,
+        # so cache them instead of walking the store on every state write
+        self._options_key: tuple[str, ...] | None = None
+        self._options: list[str] = []
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to view store changes."""
+        await super().async_added_to_hass()
+        if store := self.coordinator.get_store():
+            self.async_on_remove(store.async_add_listener(self._handle_store_update))
+
+    @callback
+    def _handle_store_update(self) -> None:
+        """Invalidate cached view names when views are edited."""
+        self._options_key = None
+        self.async_write_ha_state()
 
     @property
     def options(self) -> list[str]:
@@ -104,13 +113,18 @@ class GeekMagicCurrentViewSelect(GeekMagicEntity, SelectEntity):
         if not store:
             return []
 
-        assigned_views = self.coordinator.options.get("assigned_views", [])
+        key = tuple(self.coordinator.options.get("assigned_views", []))
+        if key == self._options_key:
+            return self._options
+
         options = []
-        for view_id in assigned_views:
+        for view_id in key:
             view = store.get_view(view_id)
             if view:
                 options.append(view.get("name", view_id))
-        return options if options else ["No views assigned"]
+        self._options = options or ["No views assigned"]
+        self._options_key = key
+        return self._options
 
     @property
     def current_option(self) -> str | None:
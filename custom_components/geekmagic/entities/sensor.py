@@ -3,119 +3,150 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfInformation
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from ..const import DOMAIN
 from .base import GeekMagicEntity
 
 if TYPE_CHECKING:
-    from ..coordinator import GeekMagicCoordinator
+    from collections.abc import Callable
+
+    from ..coordinator import GeekMagicConfigEntry, GeekMagicCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class GeekMagicSensorEntityDescription(SensorEntityDescription):
+    """Describes a GeekMagic sensor and how to read it from the coordinator."""
+
+    value_fn: Callable[[GeekMagicCoordinator], Any]
+    attrs_fn: Callable[[GeekMagicCoordinator], dict[str, Any]] | None = None
+
+
+def _status_attributes(coordinator: GeekMagicCoordinator) -> dict[str, Any]:
+    """Build extra state attributes for the status sensor."""
+    attrs: dict[str, Any] = {
+        "host": coordinator.device.host,
+        "refresh_interval": coordinator.options.get("refresh_interval", 30),
+    }
+
+    if coordinator.device_state:
+        attrs["theme"] = coordinator.device_state.theme
+        attrs["brightness"] = coordinator.device_state.brightness
+        attrs["current_image"] = coordinator.device_state.current_image
+
+    assigned_views = coordinator.options.get("assigned_views", [])
+    attrs["assigned_views"] = len(assigned_views)
+    attrs["current_screen"] = coordinator.current_screen + 1
+
+    return attrs
+
+
+def _storage_used_percent(coordinator: GeekMagicCoordinator) -> float | None:
+    """Return storage usage percentage."""
+    space_info = coordinator.space_info
+    if space_info and space_info.total > 0:
+        return round(((space_info.total - space_info.free) / space_info.total) * 100, 1)
+    return None
+
+
+def _storage_free_kb(coordinator: GeekMagicCoordinator) -> float | None:
+    """Return free storage in KB."""
+    if coordinator.space_info:
+        return round(coordinator.space_info.free / 1024, 1)
+    return None
+
+
+DEVICE_SENSORS: tuple[GeekMagicSensorEntityDescription, ...] = (
+    GeekMagicSensorEntityDescription(
+        key="status",
+        name="Status",
+        icon="mdi:monitor",
+        value_fn=lambda c: "Connected" if c.last_update_success else "Disconnected",
+        attrs_fn=_status_attributes,
+    ),
+    GeekMagicSensorEntityDescription(
+        key="storage_used",
+        name="Storage Used",
+        icon="mdi:harddisk",
+        native_unit_of_measurement=PERCENTAGE,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_storage_used_percent,
+    ),
+    GeekMagicSensorEntityDescription(
+        key="storage_free",
+        name="Storage Free",
+        icon="mdi:harddisk",
+        native_unit_of_measurement=UnitOfInformation.KILOBYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_storage_free_kb,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: GeekMagicConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up GeekMagic sensor entities."""
-    coordinator: GeekMagicCoordinator = hass.data[DOMAIN][entry.entry_id]
-
-    entities = [
-        GeekMagicStatusSensor(coordinator),
-        GeekMagicStorageUsedSensor(coordinator),
-        GeekMagicStorageFreeSensor(coordinator),
-    ]
-
-    async_add_entities(entities)
-
-
-class GeekMagicStatusSensor(GeekMagicEntity, SensorEntity):
-    """Sensor showing device connection status."""
-
-    _attr_name = "Status"
-    _attr_icon = "mdi:monitor"
-
-    def __init__(self, coordinator: GeekMagicCoordinator) -> None:
-        """Initialize status sensor."""
-        super().__init__(coordinator, "status")
+    coordinator = entry.runtime_data
+
+    async_add_entities(GeekMagicSensor(coordinator, description) for description in DEVICE_SENSORS)
+
+
+class GeekMagicSensor(GeekMagicEntity, SensorEntity):
+    """Sensor whose value is read from the coordinator via its description."""
+
+    entity_description: GeekMagicSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: GeekMagicCoordinator,
+        description: GeekMagicSensorEntityDescription,
+    ) -> None:
+        """Initialize sensor.
+
+        Args:
+            coordinator: The data update coordinator
+            description: Sensor description
+        """
+        super().__init__(coordinator, description.key)
+        self.entity_description = description
+        self._value_fn = description.value_fn
+        self._attrs_fn = description.attrs_fn
+        self._last_written: tuple[Any, ...] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when what the sensor reports has changed."""
+        snapshot = (self.available, self.native_value, self.extra_state_attributes)
+        if snapshot == self._last_written:
+            return
+        self._last_written = snapshot
+        self.async_write_ha_state()
 
     @property
-    def native_value(self) -> str:
-        """Return connection status."""
-        if self.coordinator.last_update_success:
-            return "Connected"
-        return "Disconnected"
+    def native_value(self) -> Any:
+        """Return the sensor value."""
+        return self._value_fn(self.coordinator)
 
     @property
-    def extra_state_attributes(self) -> dict:
+    def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return extra state attributes."""
-        attrs = {
-            "host": self.coordinator.device.host,
-            "refresh_interval": self.coordinator.options.get("refresh_interval", 30),
-        }
-
-        if self.coordinator.device_state:
-            attrs["theme"] = self.coordinator.device_state.theme
-            attrs["brightness"] = self.coordinator.device_state.brightness
-            attrs["current_image"] = self.coordinator.device_state.current_image
-
-        assigned_views = self.coordinator.options.get("assigned_views", [])
-        attrs["assigned_views"] = len(assigned_views)
-        attrs["current_screen"] = self.coordinator.current_screen + 1
-
-        return attrs
-
-
-class GeekMagicStorageUsedSensor(GeekMagicEntity, SensorEntity):
-    """Sensor showing storage usage percentage."""
-
-    _attr_name = "Storage Used"
-    _attr_icon = "mdi:harddisk"
-    _attr_native_unit_of_measurement = PERCENTAGE
-    _attr_device_class = SensorDeviceClass.DATA_SIZE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(self, coordinator: GeekMagicCoordinator) -> None:
-        """Initialize storage used sensor."""
-        super().__init__(coordinator, "storage_used")
-
-    @property
-    def native_value(self) -> float | None:
-        """Return storage usage percentage."""
-        if self.coordinator.space_info and self.coordinator.space_info.total > 0:
-            used = self.coordinator.space_info.total - self.coordinator.space_info.free
-            return round((used / self.coordinator.space_info.total) * 100, 1)
-        return None
-
-
-class GeekMagicStorageFreeSensor(GeekMagicEntity, SensorEntity):
-    """Sensor showing free storage in KB."""
-
-    _attr_name = "Storage Free"
-    _attr_icon = "mdi:harddisk"
-    _attr_native_unit_of_measurement = UnitOfInformation.KILOBYTES
-    _attr_device_class = SensorDeviceClass.DATA_SIZE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-
-    def __init__(self, coordinator: GeekMagicCoordinator) -> None:
-        """Initialize storage free sensor."""
-        super().__init__(coordinator, "storage_free")
-
-    @property
-    def native_value(self) -> float | None:
-        """Return free storage in KB."""
-        if self.coordinator.space_info:
-            return round(self.coordinator.space_info.free / 1024, 1)
-        return None
+        if self._attrs_fn is None:
+            return None
+        return self._attrs_fn(self.coordinator)
@@ -15,18 +15,18 @@ from homeassistant.util import dt as dt_util
 from .const import DOMAIN
 
 if TYPE_CHECKING:
-    from .coordinator import GeekMagicCoordinator
+    from .coordinator import GeekMagicConfigEntry, GeekMagicCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: GeekMagicConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up GeekMagic image from a config entry."""
-    coordinator: GeekMagicCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     _LOGGER.debug("Setting up GeekMagic image for %s", entry.data.get(CONF_HOST))
     async_add_entities([GeekMagicPreviewImage(hass, coordinator, entry)])
@@ -35,15 +35,15 @@ async def async_setup_entry(
 class GeekMagicPreviewImage(ImageEntity):
     """Image entity showing the GeekMagic display preview.
 
-    Updates only when config changes (preview_just_updated=True), not on
-    periodic coordinator refreshes. This prevents constant re-renders while
-    still showing updated previews after configuration changes.
+    Updates only when the coordinator re-renders the preview (config changes
+    or manual refresh), not on periodic coordinator refreshes. This prevents
+    constant re-renders while still showing updated previews after changes.
     """
 
     _attr_has_entity_name = True
     _attr_name = "Display Preview"
     _attr_content_type = "image/png"
-    # Disable state polling - we update via coordinator listener only on config changes
+    # Disable state polling - we update via the coordinator's preview listener
     _attr_should_poll = False
 
     def __init__(
@@ -78,20 +78,17 @@ class GeekMagicPreviewImage(ImageEntity):
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
-        # Listen to coordinator updates, but only act on config changes
-        self.async_on_remove(self.coordinator.async_add_listener(self._handle_coordinator_update))
+        # Only preview re-renders matter here, so skip the per-poll listener
+        self.async_on_remove(
+            self.coordinator.async_add_preview_listener(self._handle_preview_update)
+        )
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator.
-
-        Only updates state when preview_just_updated is True (config changed).
-        Periodic refreshes do NOT trigger state updates, preventing re-renders.
-        """
-        if self.coordinator.preview_just_updated and self.coordinator.last_image is not None:
-            self._attr_image_last_updated = dt_util.utcnow()
-            self._cached_image = None
-            self.async_write_ha_state()
+    def _handle_preview_update(self) -> None:
+        """Handle a re-rendered preview from the coordinator."""
+        self._attr_image_last_updated = dt_util.utcnow()
+        self._cached_image = None
+        self.async_write_ha_state()
 
     async def async_image(self) -> bytes | None:
         """Return the current display preview image."""
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, cast
 
 from PIL import Image
 from PIL import ImageDraw as PILImageDraw
@@ -22,9 +22,18 @@ if TYPE_CHECKING:
     from ..widgets.base import Widget
 
 
-@dataclass
+# Slot rectangles keyed by layout class and geometry. Layouts are rebuilt on every
+# options change and preview render, but their geometry comes from a small fixed set.
+_SLOT_RECTS: dict[tuple[Any, ...], tuple[tuple[int, int, int, int], ...]] = {}
+
+
+@dataclass(slots=True)
 class Slot:
-    """Represents a widget slot in a layout."""
+    """Represents a widget slot in a layout.
+
+    Rect tuples are shared between layouts with the same geometry (see
+    _SLOT_RECTS); the Slot itself is per layout because it holds the widget.
+    """
 
     index: int
     rect: tuple[int, int, int, int]  # x1, y1, x2, y2
@@ -46,13 +55,31 @@ class Layout(ABC):
         self.width = DISPLAY_WIDTH
         self.height = DISPLAY_HEIGHT
         self.slots: list[Slot] = []
+        # Placed widgets indexed by class, kept in sync by set_widget()
+        self._widgets_by_type: dict[type[Widget], list[Widget]] = {}
         self.theme: Theme = DEFAULT_THEME  # Default theme, can be overridden
-        self._calculate_slots()
+
+        # _geometry_key() reads parameters subclasses assign before calling this
+        key = (type(self), self.width, self.height, padding, gap, *self._geometry_key())
+        rects = _SLOT_RECTS.get(key)
+        if rects is None:
+            self._calculate_slots()
+            _SLOT_RECTS[key] = tuple(slot.rect for slot in self.slots)
+        else:
+            self.slots = [Slot(index=i, rect=rect) for i, rect in enumerate(rects)]
 
     @abstractmethod
     def _calculate_slots(self) -> None:
         """Calculate the slot rectangles. Override in subclasses."""
 
+    def _geometry_key(self) -> tuple[Any, ...]:
+        """Return the layout-specific parameters that determine slot geometry.
+
+        Used with the class, display size, padding and gap to key _SLOT_RECTS.
+        Override in subclasses whose _calculate_slots depends on extra parameters.
+        """
+        return ()
+
     def _available_space(self) -> tuple[int, int]:
         """Calculate available width and height after padding.
 
@@ -95,6 +122,31 @@ class Layout(ABC):
         second = content - first
         return first, second
 
+    @staticmethod
+    def _distribute(total: int, ratios: tuple[float, ...]) -> list[int]:
+        """Split a length into sections by ratio without losing pixels to rounding.
+
+        Section edges are taken from the running ratio sum, so the sizes always
+        add up to exactly ``total``.
+
+        Args:
+            total: Length to divide (gaps already excluded)
+            ratios: Relative size of each section
+
+        Returns:
+            Size of each section
+        """
+        total_ratio = sum(ratios)
+        sizes = []
+        cumulative = 0.0
+        prev_edge = 0
+        for ratio in ratios:
+            cumulative += ratio
+            edge = round(total * cumulative / total_ratio)
+            sizes.append(edge - prev_edge)
+            prev_edge = edge
+        return sizes
+
     def get_slot_count(self) -> int:
         """Return the number of widget slots."""
         return len(self.slots)
@@ -113,7 +165,22 @@ class Layout(ABC):
             widget: Widget to place
         """
         if 0 <= index < len(self.slots):
-            self.slots[index].widget = widget
+            slot = self.slots[index]
+            if slot.widget is not None:
+                self._widgets_by_type[type(slot.widget)].remove(slot.widget)
+            slot.widget = widget
+            self._widgets_by_type.setdefault(type(widget), []).append(widget)
+
+    def get_widgets_of_type[W: Widget](self, widget_type: type[W]) -> list[W]:
+        """Get placed widgets of an exact class without scanning slots.
+
+        Args:
+            widget_type: Widget class to look up
+
+        Returns:
+            Widgets of that class in placement order
+        """
+        return cast("list[W]", self._widgets_by_type.get(widget_type, []))
 
     def render(
         self,
@@ -147,24 +214,23 @@ class Layout(ABC):
 
             # Calculate slot dimensions in scaled coordinates
             x1, y1, x2, y2 = slot.rect
-            slot_width = (x2 - x1) * scale
-            slot_height = (y2 - y1) * scale
+            width = x2 - x1
+            height = y2 - y1
 
             # Create temporary image for this widget using theme's surface color
-            temp_img = Image.new("RGB", (slot_width, slot_height), self.theme.surface)
+            temp_img = Image.new("RGB", (width * scale, height * scale), self.theme.surface)
             temp_draw = PILImageDraw.Draw(temp_img)
 
             # Create render context with local coordinates (0, 0 to width, height)
             # The rect is relative to the temp image, not the main canvas
-            local_rect = (0, 0, x2 - x1, y2 - y1)
-            ctx = RenderContext(temp_draw, local_rect, renderer, theme=self.theme)
+            ctx = RenderContext(temp_draw, (0, 0, width, height), renderer, theme=self.theme)
 
             # Call widget render - may return Component tree or None (legacy)
             result = widget.render(ctx, hass)
 
             # If widget returned a Component, render it
             if isinstance(result, Component):
-                result.render(ctx, 0, 0, x2 - x1, y2 - y1)
+                result.render(ctx, 0, 0, width, height)
 
             # Paste the widget image onto the main canvas at the slot position
             paste_x = x1 * scale
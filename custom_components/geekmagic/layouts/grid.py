@@ -27,6 +27,10 @@ class GridLayout(Layout):
         self.cols = cols
         super().__init__(padding=padding, gap=gap)
 
+    def _geometry_key(self) -> tuple[int, int]:
+        """Return the grid dimensions."""
+        return (self.rows, self.cols)
+
     def _calculate_slots(self) -> None:
         """Calculate grid cell rectangles."""
         self.slots = []
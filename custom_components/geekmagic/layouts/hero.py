@@ -38,6 +38,10 @@ class HeroLayout(Layout):
         self.hero_ratio = hero_ratio
         super().__init__(padding=padding, gap=gap)
 
+    def _geometry_key(self) -> tuple[int, float]:
+        """Return the footer slot count and hero ratio."""
+        return (self.footer_slots, self.hero_ratio)
+
     def _calculate_slots(self) -> None:
         """Calculate hero and footer rectangles."""
         self.slots = []
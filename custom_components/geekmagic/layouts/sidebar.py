@@ -36,6 +36,10 @@ class SidebarLeft(Layout):
         self.ratio = ratio
         super().__init__(padding=padding, gap=gap)
 
+    def _geometry_key(self) -> tuple[float]:
+        """Return the split ratio."""
+        return (self.ratio,)
+
     def _calculate_slots(self) -> None:
         """Calculate slot rectangles."""
         self.slots = []
@@ -108,6 +112,10 @@ class SidebarRight(Layout):
         self.ratio = ratio
         super().__init__(padding=padding, gap=gap)
 
+    def _geometry_key(self) -> tuple[float]:
+        """Return the split ratio."""
+        return (self.ratio,)
+
     def _calculate_slots(self) -> None:
         """Calculate slot rectangles."""
         self.slots = []
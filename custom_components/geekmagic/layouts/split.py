@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from .base import Layout, Slot
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 
 class SplitHorizontal(Layout):
     """Horizontal split layout - side by side (left/right).
@@ -32,6 +37,10 @@ class SplitHorizontal(Layout):
         self.ratio = max(0.2, min(0.8, ratio))
         super().__init__(padding=padding, gap=gap)
 
+    def _geometry_key(self) -> tuple[float]:
+        """Return the split ratio."""
+        return (self.ratio,)
+
     def _calculate_slots(self) -> None:
         """Calculate left/right panel rectangles."""
         self.slots = []
@@ -95,6 +104,10 @@ class SplitVertical(Layout):
         self.ratio = max(0.2, min(0.8, ratio))
         super().__init__(padding=padding, gap=gap)
 
+    def _geometry_key(self) -> tuple[float]:
+        """Return the split ratio."""
+        return (self.ratio,)
+
     def _calculate_slots(self) -> None:
         """Calculate top/bottom panel rectangles."""
         self.slots = []
@@ -146,7 +159,7 @@ class ThreeColumnLayout(Layout):
 
     def __init__(
         self,
-        ratios: tuple[float, float, float] = (0.33, 0.34, 0.33),
+        ratios: Sequence[float] = (0.33, 0.34, 0.33),
         padding: int = 8,
         gap: int = 8,
     ) -> None:
@@ -157,20 +170,21 @@ class ThreeColumnLayout(Layout):
             padding: Padding around edges
             gap: Gap between columns
         """
-        self.ratios = ratios
+        self.ratios = tuple(ratios)
         super().__init__(padding=padding, gap=gap)
 
+    def _geometry_key(self) -> tuple[tuple[float, ...]]:
+        """Return the section ratios."""
+        return (self.ratios,)
+
     def _calculate_slots(self) -> None:
         """Calculate column rectangles."""
         self.slots = []
 
         available_width = self.width - (2 * self.padding) - (2 * self.gap)
-        total_ratio = sum(self.ratios)
 
         x = self.padding
-        for i, ratio in enumerate(self.ratios):
-            col_width = int(available_width * (ratio / total_ratio))
-
+        for i, col_width in enumerate(self._distribute(available_width, self.ratios)):
             self.slots.append(
                 Slot(
                     index=i,
@@ -203,7 +217,7 @@ class ThreeRowLayout(Layout):
 
     def __init__(
         self,
-        ratios: tuple[float, float, float] = (0.33, 0.34, 0.33),
+        ratios: Sequence[float] = (0.33, 0.34, 0.33),
         padding: int = 8,
         gap: int = 8,
     ) -> None:
@@ -214,20 +228,21 @@ class ThreeRowLayout(Layout):
             padding: Padding around edges
             gap: Gap between rows
         """
-        self.ratios = ratios
+        self.ratios = tuple(ratios)
         super().__init__(padding=padding, gap=gap)
 
+    def _geometry_key(self) -> tuple[tuple[float, ...]]:
+        """Return the section ratios."""
+        return (self.ratios,)
+
     def _calculate_slots(self) -> None:
         """Calculate row rectangles."""
         self.slots = []
 
         available_height = self.height - (2 * self.padding) - (2 * self.gap)
-        total_ratio = sum(self.ratios)
 
         y = self.padding
-        for i, ratio in enumerate(self.ratios):
-            row_height = int(available_height * (ratio / total_ratio))
-
+        for i, row_height in enumerate(self._distribute(available_height, self.ratios)):
             self.slots.append(
                 Slot(
                     index=i,
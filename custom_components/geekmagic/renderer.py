@@ -6,9 +6,10 @@ Uses 2x supersampling for anti-aliased output.
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from PIL import Image, ImageDraw, ImageFont
 
@@ -32,14 +33,20 @@ if TYPE_CHECKING:
 # Supersampling scale for anti-aliasing
 SUPERSAMPLE_SCALE = 2
 
+# JPEG encoder settings: baseline 4:2:0 with a single Huffman pass. These match
+# Pillow's defaults today; pinned because the device decoder needs baseline JPEG.
+_JPEG_OPTIONS = {"subsampling": 2, "optimize": False, "progressive": False}
+
 # Bundled font directory (relative to this file)
 _FONTS_DIR = Path(__file__).parent / "fonts"
 
 
+@lru_cache(maxsize=32)
 def _load_font(size: int, bold: bool = False) -> FreeTypeFont | ImageFont.ImageFont:
     """Load a TrueType font or fall back to default.
 
     Prefers bundled DejaVu Sans for consistent Unicode support across platforms.
+    Results are shared across Renderer instances; fonts are only read when drawing.
 
     Args:
         size: Font size in pixels
@@ -83,6 +90,7 @@ def _load_font(size: int, bold: bool = False) -> FreeTypeFont | ImageFont.ImageF
 _MDI_FONT = _FONTS_DIR / "materialdesignicons-webfont.ttf"
 
 
+@lru_cache(maxsize=16)
 def _load_mdi_font(size: int) -> FreeTypeFont | ImageFont.ImageFont:
     """Load MDI icon font at specified size.
 
@@ -98,6 +106,99 @@ def _load_mdi_font(size: int) -> FreeTypeFont | ImageFont.ImageFont:
         return ImageFont.load_default()
 
 
+@lru_cache(maxsize=512)
+def _text_bbox(
+    font: FreeTypeFont | ImageFont.ImageFont, text: str
+) -> tuple[float, float, float, float]:
+    """Measure text with a font, caching results.
+
+    Labels and values mostly repeat between frames, and fonts are shared
+    long-lived objects (see _load_font), so measurements can be reused.
+
+    Args:
+        font: Font to measure with
+        text: Text to measure
+
+    Returns:
+        Bounding box as (left, top, right, bottom)
+    """
+    return font.getbbox(text)
+
+
+@lru_cache(maxsize=256)
+def _text_mask(font: FreeTypeFont, text: str, anchor: str | None) -> tuple[Image.Image, int, int]:
+    """Rasterize text into a coverage mask, caching results.
+
+    Glyph rasterization dominates the cost of drawing text, and the same labels
+    are drawn on every frame. The mask is what ImageDraw.text() composites with
+    the fill color, so drawing it with ImageDraw.bitmap() gives identical pixels.
+
+    Args:
+        font: Font to rasterize with
+        text: Single-line text to rasterize
+        anchor: Text anchor (e.g., "mm" for center)
+
+    Returns:
+        Tuple of (mask, left, top), where left/top offset the mask from the anchor point
+    """
+    left, top, right, bottom = font.getbbox(text, anchor=anchor)
+    mask = Image.new("L", (max(right - left, 0), max(bottom - top, 0)))
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255, anchor=anchor)
+    return mask, left, top
+
+
+# Widgets dim and blend the same few theme colors every frame, so memoize them
+@lru_cache(maxsize=256)
+def _dim_color(color: tuple[int, int, int], factor: float) -> tuple[int, int, int]:
+    """Scale an RGB color toward black (see Renderer.dim_color)."""
+    return (
+        int(color[0] * factor),
+        int(color[1] * factor),
+        int(color[2] * factor),
+    )
+
+
+@lru_cache(maxsize=256)
+def _blend_color(
+    color1: tuple[int, int, int], color2: tuple[int, int, int], factor: float
+) -> tuple[int, int, int]:
+    """Linearly interpolate between two RGB colors (see Renderer.blend_color)."""
+    return (
+        int(color1[0] + (color2[0] - color1[0]) * factor),
+        int(color1[1] + (color2[1] - color1[1]) * factor),
+        int(color1[2] + (color2[2] - color1[2]) * factor),
+    )
+
+
+@lru_cache(maxsize=16)
+def _catmull_rom_weights(points_per_segment: int) -> tuple[tuple[float, float, float, float], ...]:
+    """Get Catmull-Rom blending weights for evenly spaced t in [0, 1).
+
+    The weights for p0..p3 ([1, t, t^2, t^3] . M) depend only on t, and
+    sparklines keep the same resolution between renders, so they are cached.
+
+    Args:
+        points_per_segment: Number of samples per curve segment
+
+    Returns:
+        Tuple of (w0, w1, w2, w3) weights, one per sample
+    """
+    weights = []
+    for j in range(points_per_segment):
+        t = j / points_per_segment
+        t2 = t * t
+        t3 = t2 * t
+        weights.append(
+            (
+                0.5 * (-t + 2 * t2 - t3),
+                0.5 * (2 - 5 * t2 + 3 * t3),
+                0.5 * (t + 4 * t2 - 3 * t3),
+                0.5 * (-t2 + t3),
+            )
+        )
+    return tuple(weights)
+
+
 class Renderer:
     """Renders widgets and layouts to images using PIL with supersampling."""
 
@@ -130,6 +231,17 @@ class Renderer:
         # MDI icon font cache (keyed by scaled size)
         self._mdi_font_cache: dict[int, FreeTypeFont | ImageFont.ImageFont] = {}
 
+        # Resolved icon glyphs and centering offsets, keyed by (icon, size)
+        self._icon_cache: dict[
+            tuple[str, int], tuple[str, FreeTypeFont | ImageFont.ImageFont, float, float]
+        ] = {}
+
+        # Persistent canvas for create_canvas(reuse=True)
+        self._canvas: tuple[Image.Image, ImageDraw.ImageDraw] | None = None
+
+        # Last encode per format: (encode settings, frame pixels, encoded bytes)
+        self._last_encoded: dict[str, tuple[tuple[Any, ...], bytes, bytes]] = {}
+
     @property
     def scale(self) -> int:
         """Return the supersampling scale factor."""
@@ -205,25 +317,38 @@ class Renderer:
 
     def _scale_rect(self, rect: tuple[int, int, int, int]) -> tuple[int, int, int, int]:
         """Scale a rectangle for supersampling."""
-        return (self._s(rect[0]), self._s(rect[1]), self._s(rect[2]), self._s(rect[3]))
+        s = self._scale
+        x1, y1, x2, y2 = rect
+        return (int(x1 * s), int(y1 * s), int(x2 * s), int(y2 * s))
 
     def _scale_point(self, point: tuple[int, int]) -> tuple[int, int]:
         """Scale a point for supersampling."""
-        return (self._s(point[0]), self._s(point[1]))
+        s = self._scale
+        return (int(point[0] * s), int(point[1] * s))
 
     def create_canvas(
-        self, background: tuple[int, int, int] = COLOR_BLACK
+        self, background: tuple[int, int, int] = COLOR_BLACK, reuse: bool = False
     ) -> tuple[Image.Image, ImageDraw.ImageDraw]:
         """Create a new image canvas at supersampled resolution.
 
         Args:
             background: RGB background color tuple
+            reuse: Clear and return this renderer's persistent canvas instead of
+                allocating a new one. The previous canvas returned with reuse=True
+                is overwritten, so callers must serialize renders.
 
         Returns:
             Tuple of (Image, ImageDraw)
         """
-        img = Image.new("RGB", (self._scaled_width, self._scaled_height), background)
-        draw = ImageDraw.Draw(img)
+        if not reuse:
+            img = Image.new("RGB", (self._scaled_width, self._scaled_height), background)
+            return img, ImageDraw.Draw(img)
+
+        if self._canvas is None:
+            img = Image.new("RGB", (self._scaled_width, self._scaled_height))
+            self._canvas = (img, ImageDraw.Draw(img))
+        img, draw = self._canvas
+        img.paste(background, (0, 0, self._scaled_width, self._scaled_height))
         return img, draw
 
     def _downscale(self, img: Image.Image) -> Image.Image:
@@ -330,7 +455,12 @@ class Renderer:
         if font is None:
             font = self.font_regular
         scaled_pos = self._scale_point(position)
-        draw.text(scaled_pos, text, font=font, fill=color, anchor=anchor)
+        if not isinstance(font, ImageFont.FreeTypeFont) or "\n" in text:
+            draw.text(scaled_pos, text, font=font, fill=color, anchor=anchor)
+            return
+
+        mask, left, top = _text_mask(font, text, anchor)
+        draw.bitmap((scaled_pos[0] + left, scaled_pos[1] + top), mask, fill=color)
 
     def draw_rect(
         self,
@@ -436,29 +566,17 @@ class Renderer:
         result = []
 
         segments = len(pts) - 3
-        points_per_segment = max(1, num_points // segments)
+        weights = _catmull_rom_weights(max(1, num_points // segments))
 
         for i in range(segments):
-            p0, p1, p2, p3 = pts[i], pts[i + 1], pts[i + 2], pts[i + 3]
-
-            for j in range(points_per_segment):
-                t = j / points_per_segment
-                t2 = t * t
-                t3 = t2 * t
-
-                x = 0.5 * (
-                    (2 * p1[0])
-                    + (-p0[0] + p2[0]) * t
-                    + (2 * p0[0] - 5 * p1[0] + 4 * p2[0] - p3[0]) * t2
-                    + (-p0[0] + 3 * p1[0] - 3 * p2[0] + p3[0]) * t3
-                )
-                y = 0.5 * (
-                    (2 * p1[1])
-                    + (-p0[1] + p2[1]) * t
-                    + (2 * p0[1] - 5 * p1[1] + 4 * p2[1] - p3[1]) * t2
-                    + (-p0[1] + 3 * p1[1] - 3 * p2[1] + p3[1]) * t3
+            (x0, y0), (x1, y1), (x2, y2), (x3, y3) = pts[i : i + 4]
+            result.extend(
+                (
+                    w0 * x0 + w1 * x1 + w2 * x2 + w3 * x3,
+                    w0 * y0 + w1 * y1 + w2 * y2 + w3 * y3,
                 )
-                result.append((x, y))
+                for w0, w1, w2, w3 in weights
+            )
 
         result.append(pts[-2])
         return result
@@ -499,11 +617,11 @@ class Renderer:
         range_val = max_val - min_val if max_val != min_val else 1
 
         # Calculate control points
-        control_points: list[tuple[float, float]] = []
-        for i, value in enumerate(data):
-            x = x1 + (i / (len(data) - 1)) * width
-            y = y2 - ((value - min_val) / range_val) * height
-            control_points.append((x, y))
+        last = len(data) - 1
+        control_points = [
+            (x1 + (i / last) * width, y2 - ((value - min_val) / range_val) * height)
+            for i, value in enumerate(data)
+        ]
 
         # Interpolate for smooth curves
         if smooth and len(control_points) >= 3:
@@ -521,7 +639,7 @@ class Renderer:
             if gradient:
                 # Gradient: blend between cool (blue) for low values and warm (orange) for high
                 # Use the average normalized value to pick a blend
-                avg_normalized = sum((v - min_val) / range_val for v in data) / len(data)
+                avg_normalized = (sum(data) / len(data) - min_val) / range_val
                 # Cool: (70, 130, 180) - Steel blue
                 # Warm: (255, 140, 0) - Dark orange
                 fill_color = (
@@ -530,7 +648,7 @@ class Renderer:
                     int(180 + (0 - 180) * avg_normalized) // 4,
                 )
             else:
-                fill_color = (color[0] // 4, color[1] // 4, color[2] // 4)
+                fill_color = _dim_color(color, 0.25)
             draw.polygon(fill_points, fill=fill_color)
 
         # Draw line
@@ -712,7 +830,9 @@ class Renderer:
         g = self._s(gap)
 
         # Normalize data
-        max_val = max(data) if max(data) > 0 else 1
+        max_val = max(data)
+        if max_val <= 0:
+            max_val = 1
         min_val = min(data)
         range_val = max_val - min_val if max_val != min_val else 1
 
@@ -720,21 +840,15 @@ class Renderer:
         available_width = x2 - x1
         num_bars = min(len(data), available_width // (bw + g))
 
-        # Use last N data points if we have more data than space
-        if len(data) > num_bars:
-            data = data[-num_bars:]
-
-        # Draw bars from right to left (most recent on right)
-        for i, value in enumerate(reversed(data)):
-            bar_x = x2 - (i + 1) * (bw + g)
-            if bar_x < x1:
-                break
-
-            bar_height = int(((value - min_val) / range_val) * height * 0.9)
-            bar_height = max(bar_height, self._s(2))
-
-            bar_y = y2 - bar_height
-            draw.rectangle((bar_x, bar_y, bar_x + bw, y2), fill=color)
+        # Draw the last num_bars values from right to left (most recent on right);
+        # num_bars already guarantees every bar starts inside the rect
+        stride = bw + g
+        height_scale = height * 0.9 / range_val
+        min_height = self._s(2)
+        for i in range(1, num_bars + 1):
+            bar_x = x2 - i * stride
+            bar_height = max(int((data[-i] - min_val) * height_scale), min_height)
+            draw.rectangle((bar_x, y2 - bar_height, bar_x + bw, y2), fill=color)
 
     def draw_panel(
         self,
@@ -793,7 +907,8 @@ class Renderer:
         if not xy or len(xy) < 2:
             return
 
-        scaled_xy = [self._scale_point(p) for p in xy]
+        s = self._scale
+        scaled_xy = [(int(x * s), int(y * s)) for x, y in xy]
         draw.line(scaled_xy, fill=fill, width=self._s(width))
 
     def draw_icon(
@@ -819,28 +934,43 @@ class Renderer:
             size: Icon size in pixels
             color: Icon color (RGB tuple)
         """
-        # Get the MDI character for this icon
-        mdi_char = get_mdi_char(icon)
+        key = (icon, size)
+        glyph = self._icon_cache.get(key)
+        if glyph is None:
+            glyph = self._icon_cache[key] = self._layout_icon(icon, size)
+        mdi_char, font, offset_x, offset_y = glyph
 
-        # Get appropriately sized MDI font
-        font = self.get_mdi_font(size)
-
-        # Scale position for supersampling
+        # Scale position for supersampling and center icon in its box
         x, y = self._scale_point(position)
-        scaled_size = self._s(size)
+        draw.text((x + offset_x, y + offset_y), mdi_char, font=font, fill=color)
 
-        # Center icon in bounding box
-        bbox = font.getbbox(mdi_char)
-        if bbox:
-            char_width = bbox[2] - bbox[0]
-            char_height = bbox[3] - bbox[1]
-            offset_x = (scaled_size - char_width) // 2 - bbox[0]
-            offset_y = (scaled_size - char_height) // 2 - bbox[1]
-            x += offset_x
-            y += offset_y
+    def _layout_icon(
+        self, icon: str, size: int
+    ) -> tuple[str, FreeTypeFont | ImageFont.ImageFont, float, float]:
+        """Resolve an icon's glyph, font and centering offset for a given size.
+
+        Args:
+            icon: Icon name in any format accepted by draw_icon
+            size: Icon size in pixels
+
+        Returns:
+            Tuple of (character, font, x offset, y offset) in scaled pixels
+        """
+        mdi_char = get_mdi_char(icon)
+        font = self.get_mdi_font(size)
+        scaled_size = self._s(size)
 
-        # Draw the icon character
-        draw.text((x, y), mdi_char, font=font, fill=color)
+        bbox = _text_bbox(font, mdi_char)
+        if not bbox:
+            return mdi_char, font, 0, 0
+        char_width = bbox[2] - bbox[0]
+        char_height = bbox[3] - bbox[1]
+        return (
+            mdi_char,
+            font,
+            (scaled_size - char_width) // 2 - bbox[0],
+            (scaled_size - char_height) // 2 - bbox[1],
+        )
 
     def dim_color(self, color: tuple[int, int, int], factor: float = 0.3) -> tuple[int, int, int]:
         """Dim a color by a factor.
@@ -852,11 +982,7 @@ class Renderer:
         Returns:
             Dimmed RGB color
         """
-        return (
-            int(color[0] * factor),
-            int(color[1] * factor),
-            int(color[2] * factor),
-        )
+        return _dim_color(color, factor)
 
     def blend_color(
         self,
@@ -874,11 +1000,7 @@ class Renderer:
         Returns:
             Blended RGB color
         """
-        return (
-            int(color1[0] + (color2[0] - color1[0]) * factor),
-            int(color1[1] + (color2[1] - color1[1]) * factor),
-            int(color1[2] + (color2[2] - color1[2]) * factor),
-        )
+        return _blend_color(color1, color2, factor)
 
     def get_text_size(
         self,
@@ -897,7 +1019,7 @@ class Renderer:
         if font is None:
             font = self.font_regular
 
-        bbox = font.getbbox(text)
+        bbox = _text_bbox(font, text)
         if bbox:
             return int((bbox[2] - bbox[0]) / self._scale), int((bbox[3] - bbox[1]) / self._scale)
         return 0, 0
@@ -929,27 +1051,43 @@ class Renderer:
         Returns:
             JPEG image bytes
         """
+        # Finalize (downscale) before export
+        final_img = self.finalize(img)
+        return self._encode_jpeg(final_img, final_img.tobytes(), quality, max_size)
+
+    def _encode_jpeg(
+        self,
+        final_img: Image.Image,
+        pixels: bytes,
+        quality: int,
+        max_size: int | None,
+    ) -> bytes:
+        """Encode a finalized image to JPEG, lowering quality to fit max_size."""
         from .const import MAX_IMAGE_SIZE
 
         if max_size is None:
             max_size = MAX_IMAGE_SIZE
 
-        # Finalize (downscale) before export
-        final_img = self.finalize(img)
+        settings = (quality, max_size)
+        cached = self._get_encoded("JPEG", settings, pixels)
+        if cached is not None:
+            return cached
 
         # Try at requested quality first
         buffer = BytesIO()
-        final_img.save(buffer, format="JPEG", quality=quality)
+        final_img.save(buffer, format="JPEG", quality=quality, **_JPEG_OPTIONS)
         result = buffer.getvalue()
 
-        # Reduce quality if size exceeds max
+        # Reduce quality if size exceeds max, reusing the same buffer
         current_quality = quality
         while len(result) > max_size and current_quality > 20:
             current_quality -= 10
-            buffer = BytesIO()
-            final_img.save(buffer, format="JPEG", quality=current_quality)
+            buffer.seek(0)
+            buffer.truncate()
+            final_img.save(buffer, format="JPEG", quality=current_quality, **_JPEG_OPTIONS)
             result = buffer.getvalue()
 
+        self._last_encoded["JPEG"] = (settings, pixels, result)
         return result
 
     def to_png(self, img: Image.Image) -> bytes:
@@ -963,9 +1101,57 @@ class Renderer:
         """
         # Finalize (downscale) before export
         final_img = self.finalize(img)
+        return self._encode_png(final_img, final_img.tobytes())
+
+    def _encode_png(self, final_img: Image.Image, pixels: bytes) -> bytes:
+        """Encode a finalized image to PNG."""
+        cached = self._get_encoded("PNG", (), pixels)
+        if cached is not None:
+            return cached
+
         buffer = BytesIO()
         final_img.save(buffer, format="PNG")
-        return buffer.getvalue()
+        result = buffer.getvalue()
+        self._last_encoded["PNG"] = ((), pixels, result)
+        return result
+
+    def to_jpeg_and_png(self, img: Image.Image) -> tuple[bytes, bytes]:
+        """Convert image to both JPEG and PNG bytes.
+
+        The supersampled image is downscaled and read out once, and both
+        encoders share the result.
+
+        Args:
+            img: PIL Image
+
+        Returns:
+            Tuple of (jpeg_bytes, png_bytes)
+        """
+        final_img = self.finalize(img)
+        pixels = final_img.tobytes()
+        return (
+            self._encode_jpeg(final_img, pixels, DEFAULT_JPEG_QUALITY, None),
+            self._encode_png(final_img, pixels),
+        )
+
+    def _get_encoded(self, fmt: str, settings: tuple[Any, ...], pixels: bytes) -> bytes | None:
+        """Return the previous encode if the frame and settings are unchanged.
+
+        Most refreshes redraw the same values, so the frame is often identical
+        to the last one and re-encoding it would produce the same bytes.
+
+        Args:
+            fmt: Image format name
+            settings: Encoder settings that affect the output
+            pixels: Raw pixel data of the finalized frame
+
+        Returns:
+            Cached encoded bytes, or None if the frame must be encoded
+        """
+        last = self._last_encoded.get(fmt)
+        if last is not None and last[0] == settings and last[1] == pixels:
+            return last[2]
+        return None
 
     def draw_welcome_screen(self, draw: ImageDraw.ImageDraw) -> None:
         """Draw a welcome screen when no configuration is set.
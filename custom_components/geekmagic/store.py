@@ -23,6 +23,8 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = f"{DOMAIN}.views"
 STORAGE_VERSION = 1
+# Seconds to coalesce rapid edits (e.g. from the view editor) into one disk write
+SAVE_DELAY = 1
 
 
 class GeekMagicStore:
@@ -49,10 +51,21 @@ class GeekMagicStore:
             _LOGGER.debug("No existing views in storage, starting fresh")
 
     async def async_save(self) -> None:
-        """Save current data to disk."""
-        await self._store.async_save(self._data)
+        """Schedule a save of current data to disk and notify listeners.
+
+        This does not wait for the write: it returns as soon as the save is
+        queued. Writes are debounced by SAVE_DELAY so a burst of edits results
+        in a single write, and Store flushes any pending data on Home
+        Assistant's final write at shutdown. Listeners are notified right away.
+        """
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
         self._notify_listeners()
 
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return data to persist."""
+        return self._data
+
     def _notify_listeners(self) -> None:
         """Notify all listeners of data change."""
         for listener in self._listeners:
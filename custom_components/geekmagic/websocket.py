@@ -5,6 +5,7 @@ Provides commands for managing views, devices, and preview rendering.
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
 from datetime import datetime, timedelta
@@ -12,6 +13,7 @@ from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.util import dt as dt_util
@@ -27,6 +29,7 @@ from .const import (
     THEME_CLASSIC,
     THEME_OPTIONS,
 )
+from .coordinator import get_loaded_coordinators
 from .renderer import Renderer
 from .widgets.base import WidgetConfig
 
@@ -274,6 +277,48 @@ WIDGET_TYPE_SCHEMAS: dict[str, dict[str, Any]] = {
 }
 
 
+def _coerce_color(value: Any) -> tuple[int, int, int] | None:
+    """Coerce an RGB list to a tuple, ignoring anything malformed."""
+    if isinstance(value, list | tuple) and len(value) == 3:
+        try:
+            return (int(value[0]), int(value[1]), int(value[2]))
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def _coerce_options(value: Any) -> dict[str, Any]:
+    """Coerce widget options to a dict, treating null as no options."""
+    if value is None:
+        return {}
+    if not isinstance(value, dict):
+        raise vol.Invalid("expected a dictionary")
+    return value
+
+
+# Validates and fills defaults for preview payloads once, at dispatch time
+PREVIEW_WIDGET_SCHEMA = vol.Schema(
+    {
+        vol.Required("type"): str,
+        vol.Optional("slot", default=0): vol.Coerce(int),
+        vol.Optional("entity_id"): vol.Any(None, str),
+        vol.Optional("label"): vol.Any(None, vol.Coerce(str)),
+        vol.Optional("color"): _coerce_color,
+        vol.Optional("options", default=dict): _coerce_options,
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+PREVIEW_VIEW_SCHEMA = vol.Schema(
+    {
+        vol.Optional("layout", default=LAYOUT_GRID_2X2): str,
+        vol.Optional("theme", default=THEME_CLASSIC): str,
+        vol.Optional("widgets", default=list): [PREVIEW_WIDGET_SCHEMA],
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
 def async_register_websocket_commands(hass: HomeAssistant) -> None:
     """Register all WebSocket commands."""
     # Views
@@ -306,6 +351,16 @@ def async_register_websocket_commands(hass: HomeAssistant) -> None:
 # =============================================================================
 
 
+# Built from constants only, so assemble it once rather than per panel load
+PANEL_CONFIG: dict[str, Any] = {
+    "widget_types": WIDGET_TYPE_SCHEMAS,
+    "layout_types": {
+        k: {"slots": v, "name": k.replace("_", " ").title()} for k, v in LAYOUT_SLOT_COUNTS.items()
+    },
+    "themes": dict(THEME_OPTIONS.items()),
+}
+
+
 @websocket_api.websocket_command({vol.Required("type"): "geekmagic/config"})
 @callback
 def ws_get_config(
@@ -314,17 +369,7 @@ def ws_get_config(
     msg: dict[str, Any],
 ) -> None:
     """Get full configuration for the panel."""
-    connection.send_result(
-        msg["id"],
-        {
-            "widget_types": WIDGET_TYPE_SCHEMAS,
-            "layout_types": {
-                k: {"slots": v, "name": k.replace("_", " ").title()}
-                for k, v in LAYOUT_SLOT_COUNTS.items()
-            },
-            "themes": dict(THEME_OPTIONS.items()),
-        },
-    )
+    connection.send_result(msg["id"], PANEL_CONFIG)
 
 
 # =============================================================================
@@ -458,10 +503,7 @@ async def ws_views_delete(
     await store.async_delete_view(view_id)
 
     # Remove from all device assignments
-    for key, data in hass.data[DOMAIN].items():
-        if key == "store" or not hasattr(data, "config_entry"):
-            continue
-        coordinator: GeekMagicCoordinator = data
+    for coordinator in get_loaded_coordinators(hass):
         assigned = coordinator.options.get("assigned_views", [])
         if view_id in assigned:
             entry = coordinator.config_entry
@@ -517,28 +559,24 @@ def ws_devices_list(
     msg: dict[str, Any],
 ) -> None:
     """Get all GeekMagic devices with their assignments."""
-    devices = []
-    for key, data in hass.data.get(DOMAIN, {}).items():
-        if key == "store" or not hasattr(data, "device"):
-            continue
-        coordinator: GeekMagicCoordinator = data
-        devices.append(
-            {
-                "entry_id": coordinator.config_entry.entry_id if coordinator.config_entry else key,
-                "name": coordinator.device_name,
-                "host": coordinator.device.host,
-                "assigned_views": coordinator.options.get("assigned_views", []),
-                "current_view_index": coordinator.current_screen,
-                "brightness": coordinator.brightness,
-                "refresh_interval": coordinator.options.get(
-                    CONF_REFRESH_INTERVAL, DEFAULT_REFRESH_INTERVAL
-                ),
-                "cycle_interval": coordinator.options.get(
-                    CONF_SCREEN_CYCLE_INTERVAL, DEFAULT_SCREEN_CYCLE_INTERVAL
-                ),
-                "online": coordinator.last_update_success,
-            }
-        )
+    devices = [
+        {
+            "entry_id": coordinator.config_entry.entry_id,
+            "name": coordinator.device_name,
+            "host": coordinator.device.host,
+            "assigned_views": coordinator.options.get("assigned_views", []),
+            "current_view_index": coordinator.current_screen,
+            "brightness": coordinator.brightness,
+            "refresh_interval": coordinator.options.get(
+                CONF_REFRESH_INTERVAL, DEFAULT_REFRESH_INTERVAL
+            ),
+            "cycle_interval": coordinator.options.get(
+                CONF_SCREEN_CYCLE_INTERVAL, DEFAULT_SCREEN_CYCLE_INTERVAL
+            ),
+            "online": coordinator.last_update_success,
+        }
+        for coordinator in get_loaded_coordinators(hass)
+    ]
     connection.send_result(msg["id"], {"devices": devices})
 
 
@@ -549,8 +587,8 @@ def ws_devices_list(
         vol.Required("view_ids"): [str],
     }
 )
-@websocket_api.async_response
-async def ws_devices_assign_views(
+@callback
+def ws_devices_assign_views(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
@@ -668,10 +706,28 @@ def _extract_numeric_values(history_states: list) -> list[float]:
     return extract_numeric_values(history_states)
 
 
+def _get_preview_renderer(hass: HomeAssistant) -> Renderer:
+    """Get the Renderer shared by panel previews, creating it on first use.
+
+    Must be called from the executor, as the first Renderer loads its fonts.
+
+    Args:
+        hass: Home Assistant instance
+
+    Returns:
+        Shared preview Renderer
+    """
+    domain_data = hass.data[DOMAIN]
+    renderer: Renderer | None = domain_data.get("preview_renderer")
+    if renderer is None:
+        renderer = domain_data["preview_renderer"] = Renderer()
+    return renderer
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "geekmagic/preview/render",
-        vol.Required("view_config"): dict,
+        vol.Required("view_config"): PREVIEW_VIEW_SCHEMA,
     }
 )
 @websocket_api.async_response
@@ -697,13 +753,12 @@ async def ws_preview_render(
         recorder = get_instance(hass)
         now = dt_util.utcnow()
 
-        for widget_data in view_config.get("widgets", []):
-            if widget_data.get("type") == "chart":
+        for widget_data in view_config["widgets"]:
+            if widget_data["type"] == "chart":
                 entity_id = widget_data.get("entity_id")
                 if entity_id:
                     # Get period from widget options (default 24 hours)
-                    options = widget_data.get("options", {})
-                    period = options.get("period", "24 hours")
+                    period = widget_data["options"].get("period", "24 hours")
 
                     # Convert period to hours
                     period_hours = {
@@ -735,23 +790,21 @@ async def ws_preview_render(
 
     def _render() -> bytes:
         """Render the view (runs in executor)."""
-        renderer = Renderer()
+        renderer = _get_preview_renderer(hass)
 
         # Create layout
-        layout_type = view_config.get("layout", LAYOUT_GRID_2X2)
-        layout_class = LAYOUT_CLASSES.get(layout_type)
+        layout_class = LAYOUT_CLASSES.get(view_config["layout"])
         if not layout_class:
             layout_class = LAYOUT_CLASSES[LAYOUT_GRID_2X2]
         layout = layout_class()
 
         # Set theme
-        theme_name = view_config.get("theme", THEME_CLASSIC)
-        layout.theme = get_theme(theme_name)
+        layout.theme = get_theme(view_config["theme"])
 
-        # Add widgets
-        for widget_data in view_config.get("widgets", []):
-            widget_type = widget_data.get("type")
-            slot = widget_data.get("slot", 0)
+        # Add widgets (fields already validated and coerced by PREVIEW_VIEW_SCHEMA)
+        for widget_data in view_config["widgets"]:
+            widget_type = widget_data["type"]
+            slot = widget_data["slot"]
 
             if slot >= layout.get_slot_count():
                 continue
@@ -760,18 +813,13 @@ async def ws_preview_render(
             if not widget_class:
                 continue
 
-            raw_color = widget_data.get("color")
-            parsed_color = None
-            if isinstance(raw_color, list | tuple) and len(raw_color) == 3:
-                parsed_color = (int(raw_color[0]), int(raw_color[1]), int(raw_color[2]))
-
             config = WidgetConfig(
                 widget_type=widget_type,
                 slot=slot,
                 entity_id=widget_data.get("entity_id"),
                 label=widget_data.get("label"),
-                color=parsed_color,
-                options=widget_data.get("options", {}),
+                color=widget_data.get("color"),
+                options=widget_data["options"],
             )
             widget = widget_class(config)
 
@@ -926,19 +974,26 @@ def ws_entities_list(
 
 def _get_coordinator(hass: HomeAssistant, entry_id: str) -> GeekMagicCoordinator | None:
     """Get coordinator by entry ID."""
-    data = hass.data.get(DOMAIN, {}).get(entry_id)
-    if data and hasattr(data, "device"):
-        return data
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if entry and entry.domain == DOMAIN and entry.state is ConfigEntryState.LOADED:
+        return entry.runtime_data
     return None
 
 
 async def _notify_coordinators_of_view_change(hass: HomeAssistant, view_id: str) -> None:
-    """Notify all coordinators using a view that it changed."""
-    for key, data in hass.data.get(DOMAIN, {}).items():
-        if key == "store" or not hasattr(data, "device"):
-            continue
-        coordinator: GeekMagicCoordinator = data
-        assigned = coordinator.options.get("assigned_views", [])
-        if view_id in assigned:
-            # Reload views from store and refresh display
-            await coordinator.async_reload_views()
+    """Notify all coordinators using a view that it changed.
+
+    Devices are refreshed concurrently so one slow device does not delay the rest.
+    """
+    coordinators = [
+        coordinator
+        for coordinator in get_loaded_coordinators(hass)
+        if view_id in coordinator.options.get("assigned_views", [])
+    ]
+    results = await asyncio.gather(
+        *(coordinator.async_reload_views() for coordinator in coordinators),
+        return_exceptions=True,
+    )
+    for coordinator, result in zip(coordinators, results, strict=True):
+        if isinstance(result, Exception):
+            _LOGGER.error("Failed to reload views for %s: %s", coordinator.device_name, result)
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from .components import Component
 
 
-@dataclass
+@dataclass(slots=True)
 class WidgetConfig:
     """Configuration for a widget."""
 
@@ -100,18 +100,17 @@ class CameraWidget(Widget):
             return self._cached_image
 
         try:
-            # Get pre-fetched image from coordinator
-            from ..const import DOMAIN
+            # Get pre-fetched image from coordinator (imported here, coordinator imports widgets)
+            from ..coordinator import get_loaded_coordinators
 
             # Find the coordinator that has this camera image
-            for coordinator in hass.data.get(DOMAIN, {}).values():
-                if hasattr(coordinator, "get_camera_image"):
-                    image_bytes = coordinator.get_camera_image(entity_id)
-                    if image_bytes:
-                        self._cached_image = Image.open(BytesIO(image_bytes))
-                        self._cached_image = self._cached_image.convert("RGB")
-                        self._last_entity_id = entity_id
-                        return self._cached_image
+            for coordinator in get_loaded_coordinators(hass):
+                image_bytes = coordinator.get_camera_image(entity_id)
+                if image_bytes:
+                    self._cached_image = Image.open(BytesIO(image_bytes))
+                    self._cached_image = self._cached_image.convert("RGB")
+                    self._last_entity_id = entity_id
+                    return self._cached_image
 
         except Exception as e:
             _LOGGER.debug("Error getting camera image for %s: %s", entity_id, e)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import contextlib
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -14,6 +14,9 @@ if TYPE_CHECKING:
 ON_STATES = frozenset({"on", "true", "home", "locked", "1"})
 
 
+# Labels and states are stable between frames, so the same strings are truncated repeatedly.
+# Sized for every text field of several devices' screens; changing values age out.
+@lru_cache(maxsize=2048)
 def truncate_text(
     text: str,
     max_chars: int,
@@ -76,9 +79,10 @@ def extract_numeric(
     raw_value = state.attributes.get(attribute) if attribute else state.state
     if raw_value is None:
         return default
-    with contextlib.suppress(ValueError, TypeError):
+    try:
         return float(raw_value)
-    return default
+    except (ValueError, TypeError):
+        return default
 
 
 def resolve_label(
@@ -145,7 +149,9 @@ def is_entity_on(state: State | None) -> bool:
     """
     if state is None:
         return False
-    return state.state.lower() in ON_STATES
+    # HA states are normally lowercase already; only lowercase on a miss
+    value = state.state
+    return value in ON_STATES or value.lower() in ON_STATES
 
 
 def get_unit(state: State | None, default: str = "") -> str:
@@ -185,12 +191,28 @@ def get_entity_icon(state: State | None) -> str | None:
     if icon:
         return icon
 
+    return _resolve_default_icon(state.entity_id, state.attributes.get("device_class"))
+
+
+@lru_cache(maxsize=1024)
+def _resolve_default_icon(entity_id: str, device_class: str | None) -> str | None:
+    """Resolve the fallback icon for an entity without an explicit icon.
+
+    Cached on plain strings rather than the State, which is neither hashable
+    nor stable between renders.
+
+    Args:
+        entity_id: Entity ID
+        device_class: Device class attribute, if any
+
+    Returns:
+        Icon string in MDI format or None if not found
+    """
     # Get domain from entity_id
-    entity_id = state.entity_id
-    domain = entity_id.split(".")[0] if "." in entity_id else None
+    prefix, dot, _ = entity_id.partition(".")
+    domain = prefix if dot else None
 
     # Check device class for domain-specific icons
-    device_class = state.attributes.get("device_class")
     if device_class:
         device_class_icon = _get_device_class_icon(domain, device_class)
         if device_class_icon:
@@ -203,109 +225,109 @@ def get_entity_icon(state: State | None) -> str | None:
     return None
 
 
+# Default icons by device class (sensors and binary sensors)
+_DEVICE_CLASS_ICONS: dict[str, str] = {
+    # Sensors
+    "temperature": "mdi:thermometer",
+    "humidity": "mdi:water-percent",
+    "pressure": "mdi:gauge",
+    "battery": "mdi:battery",
+    "power": "mdi:flash",
+    "energy": "mdi:lightning-bolt",
+    "voltage": "mdi:sine-wave",
+    "current": "mdi:current-ac",
+    "frequency": "mdi:sine-wave",
+    "illuminance": "mdi:brightness-5",
+    "signal_strength": "mdi:wifi",
+    "carbon_dioxide": "mdi:molecule-co2",
+    "carbon_monoxide": "mdi:molecule-co",
+    "pm25": "mdi:blur",
+    "pm10": "mdi:blur",
+    "volatile_organic_compounds": "mdi:air-filter",
+    "nitrogen_dioxide": "mdi:molecule",
+    "ozone": "mdi:molecule",
+    "sulphur_dioxide": "mdi:molecule",
+    "timestamp": "mdi:clock",
+    "duration": "mdi:timer",
+    "moisture": "mdi:water",
+    "gas": "mdi:gas-cylinder",
+    "speed": "mdi:speedometer",
+    "wind_speed": "mdi:weather-windy",
+    "weight": "mdi:weight",
+    "distance": "mdi:ruler",
+    "monetary": "mdi:currency-usd",
+    "data_rate": "mdi:download",
+    "data_size": "mdi:database",
+    # Binary sensors
+    "motion": "mdi:motion-sensor",
+    "door": "mdi:door",
+    "window": "mdi:window-closed",
+    "opening": "mdi:door-open",
+    "presence": "mdi:home-account",
+    "occupancy": "mdi:home-account",
+    "smoke": "mdi:smoke-detector",
+    "lock": "mdi:lock",
+    "plug": "mdi:power-plug",
+    "connectivity": "mdi:connection",
+    "problem": "mdi:alert-circle",
+    "safety": "mdi:shield-check",
+    "sound": "mdi:microphone",
+    "vibration": "mdi:vibrate",
+    "running": "mdi:play-circle",
+    "update": "mdi:package-up",
+}
+
+# Default icons by entity domain
+_DOMAIN_ICONS: dict[str, str] = {
+    "sensor": "mdi:eye",
+    "binary_sensor": "mdi:checkbox-blank-circle",
+    "switch": "mdi:toggle-switch",
+    "light": "mdi:lightbulb",
+    "fan": "mdi:fan",
+    "climate": "mdi:thermostat",
+    "lock": "mdi:lock",
+    "cover": "mdi:window-shutter",
+    "camera": "mdi:camera",
+    "media_player": "mdi:cast",
+    "vacuum": "mdi:robot-vacuum",
+    "weather": "mdi:weather-partly-cloudy",
+    "person": "mdi:account",
+    "device_tracker": "mdi:crosshairs-gps",
+    "automation": "mdi:robot",
+    "script": "mdi:script-text",
+    "scene": "mdi:palette",
+    "input_boolean": "mdi:toggle-switch",
+    "input_number": "mdi:ray-vertex",
+    "input_select": "mdi:format-list-bulleted",
+    "input_text": "mdi:form-textbox",
+    "input_datetime": "mdi:calendar-clock",
+    "input_button": "mdi:gesture-tap-button",
+    "counter": "mdi:counter",
+    "timer": "mdi:timer",
+    "calendar": "mdi:calendar",
+    "alarm_control_panel": "mdi:shield-home",
+    "number": "mdi:ray-vertex",
+    "select": "mdi:format-list-bulleted",
+    "button": "mdi:gesture-tap-button",
+    "text": "mdi:form-textbox",
+    "update": "mdi:package-up",
+    "water_heater": "mdi:water-boiler",
+    "humidifier": "mdi:air-humidifier",
+    "remote": "mdi:remote",
+    "siren": "mdi:bullhorn",
+    "lawn_mower": "mdi:robot-mower",
+    "valve": "mdi:valve",
+}
+
+
 def _get_device_class_icon(domain: str | None, device_class: str) -> str | None:
     """Get icon for a device class."""
-    # Common device class icons
-    device_class_icons = {
-        # Sensors
-        "temperature": "mdi:thermometer",
-        "humidity": "mdi:water-percent",
-        "pressure": "mdi:gauge",
-        "battery": "mdi:battery",
-        "power": "mdi:flash",
-        "energy": "mdi:lightning-bolt",
-        "voltage": "mdi:sine-wave",
-        "current": "mdi:current-ac",
-        "frequency": "mdi:sine-wave",
-        "illuminance": "mdi:brightness-5",
-        "signal_strength": "mdi:wifi",
-        "carbon_dioxide": "mdi:molecule-co2",
-        "carbon_monoxide": "mdi:molecule-co",
-        "pm25": "mdi:blur",
-        "pm10": "mdi:blur",
-        "volatile_organic_compounds": "mdi:air-filter",
-        "nitrogen_dioxide": "mdi:molecule",
-        "ozone": "mdi:molecule",
-        "sulphur_dioxide": "mdi:molecule",
-        "timestamp": "mdi:clock",
-        "duration": "mdi:timer",
-        "moisture": "mdi:water",
-        "gas": "mdi:gas-cylinder",
-        "speed": "mdi:speedometer",
-        "wind_speed": "mdi:weather-windy",
-        "weight": "mdi:weight",
-        "distance": "mdi:ruler",
-        "monetary": "mdi:currency-usd",
-        "data_rate": "mdi:download",
-        "data_size": "mdi:database",
-        # Binary sensors
-        "motion": "mdi:motion-sensor",
-        "door": "mdi:door",
-        "window": "mdi:window-closed",
-        "opening": "mdi:door-open",
-        "presence": "mdi:home-account",
-        "occupancy": "mdi:home-account",
-        "smoke": "mdi:smoke-detector",
-        "lock": "mdi:lock",
-        "plug": "mdi:power-plug",
-        "connectivity": "mdi:connection",
-        "problem": "mdi:alert-circle",
-        "safety": "mdi:shield-check",
-        "sound": "mdi:microphone",
-        "vibration": "mdi:vibrate",
-        "running": "mdi:play-circle",
-        "update": "mdi:package-up",
-    }
-    return (
-        f"mdi:{device_class_icons.get(device_class, '').replace('mdi:', '')}"
-        if device_class in device_class_icons
-        else None
-    )
+    return _DEVICE_CLASS_ICONS.get(device_class)
 
 
 def _get_domain_icon(domain: str) -> str | None:
     """Get default icon for a domain."""
-    domain_icons = {
-        "sensor": "mdi:eye",
-        "binary_sensor": "mdi:checkbox-blank-circle",
-        "switch": "mdi:toggle-switch",
-        "light": "mdi:lightbulb",
-        "fan": "mdi:fan",
-        "climate": "mdi:thermostat",
-        "lock": "mdi:lock",
-        "cover": "mdi:window-shutter",
-        "camera": "mdi:camera",
-        "media_player": "mdi:cast",
-        "vacuum": "mdi:robot-vacuum",
-        "weather": "mdi:weather-partly-cloudy",
-        "person": "mdi:account",
-        "device_tracker": "mdi:crosshairs-gps",
-        "automation": "mdi:robot",
-        "script": "mdi:script-text",
-        "scene": "mdi:palette",
-        "input_boolean": "mdi:toggle-switch",
-        "input_number": "mdi:ray-vertex",
-        "input_select": "mdi:format-list-bulleted",
-        "input_text": "mdi:form-textbox",
-        "input_datetime": "mdi:calendar-clock",
-        "input_button": "mdi:gesture-tap-button",
-        "counter": "mdi:counter",
-        "timer": "mdi:timer",
-        "calendar": "mdi:calendar",
-        "alarm_control_panel": "mdi:shield-home",
-        "number": "mdi:ray-vertex",
-        "select": "mdi:format-list-bulleted",
-        "button": "mdi:gesture-tap-button",
-        "text": "mdi:form-textbox",
-        "update": "mdi:package-up",
-        "water_heater": "mdi:water-boiler",
-        "humidifier": "mdi:air-humidifier",
-        "remote": "mdi:remote",
-        "siren": "mdi:bullhorn",
-        "lawn_mower": "mdi:robot-mower",
-        "valve": "mdi:valve",
-    }
-    return domain_icons.get(domain)
+    return _DOMAIN_ICONS.get(domain)
 
 
 def estimate_max_chars(
@@ -369,14 +391,15 @@ def extract_state_value(
     if state is None:
         return 0.0, default_value, default_unit
 
-    raw_value = state.attributes.get(attribute) if attribute else state.state
-    unit = state.attributes.get("unit_of_measurement", default_unit)
+    attributes = state.attributes
+    raw_value = attributes.get(attribute) if attribute else state.state
+    unit = attributes.get("unit_of_measurement", default_unit)
 
     if raw_value is None:
         return 0.0, default_value, unit
 
-    with contextlib.suppress(ValueError, TypeError):
+    try:
         numeric = float(raw_value)
-        return numeric, f"{numeric:.0f}", unit
-
-    return 0.0, default_value, unit
+    except (ValueError, TypeError):
+        return 0.0, default_value, unit
+    return numeric, f"{numeric:.0f}", unit
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from ..const import COLOR_CYAN, COLOR_GRAY, COLOR_WHITE
 from .base import Widget, WidgetConfig
+from .helpers import calculate_percent, truncate_text
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -52,21 +54,15 @@ class MediaWidget(Widget):
             self._render_idle(ctx)
             return
 
-        # Get media info
+        # Get media info, truncated to fit (cached, so unchanged tracks are cheap)
         attrs = state.attributes
-        title = attrs.get("media_title", "Unknown")
-        artist = attrs.get("media_artist", "")
-        album = attrs.get("media_album_name", "")
+        max_chars = (ctx.width - padding * 2) // 8
+        title = truncate_text(attrs.get("media_title", "Unknown"), max_chars)
+        artist = truncate_text(attrs.get("media_artist", ""), max_chars)
+        album = truncate_text(attrs.get("media_album_name", ""), max_chars)
         position = attrs.get("media_position", 0)
         duration = attrs.get("media_duration", 0)
 
-        # Truncate text if needed
-        max_chars = (ctx.width - padding * 2) // 8
-        if len(title) > max_chars:
-            title = title[: max_chars - 2] + ".."
-        if len(artist) > max_chars:
-            artist = artist[: max_chars - 2] + ".."
-
         # Calculate positions relative to container
         current_y = int(ctx.height * 0.12)
 
@@ -103,8 +99,6 @@ class MediaWidget(Widget):
 
         # Draw album
         if self.show_album and album:
-            if len(album) > max_chars:
-                album = album[: max_chars - 2] + ".."
             ctx.draw_text(
                 album,
                 (center_x, current_y),
@@ -118,7 +112,7 @@ class MediaWidget(Widget):
             bar_height = max(4, int(ctx.height * 0.05))
             bar_y = ctx.height - int(ctx.height * 0.21)
             bar_rect = (padding, bar_y, ctx.width - padding, bar_y + bar_height)
-            progress = min(100, (position / duration) * 100)
+            progress = calculate_percent(position, 0, duration)
             ctx.draw_bar(
                 bar_rect,
                 progress,
@@ -185,12 +179,18 @@ class MediaWidget(Widget):
 
     def _format_time(self, seconds: float) -> str:
         """Format seconds as MM:SS or HH:MM:SS."""
-        seconds = int(seconds)
-        if seconds >= 3600:
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            secs = seconds % 60
-            return f"{hours}:{minutes:02d}:{secs:02d}"
-        minutes = seconds // 60
-        secs = seconds % 60
-        return f"{minutes}:{secs:02d}"
+        return _format_seconds(int(seconds))
+
+
+@lru_cache(maxsize=128)
+def _format_seconds(seconds: int) -> str:
+    """Format whole seconds as MM:SS or HH:MM:SS.
+
+    Position and duration only change when the player reports them, so most
+    frames format the same two values again.
+    """
+    minutes, secs = divmod(seconds, 60)
+    if minutes >= 60:
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
@@ -123,10 +123,16 @@ class StatusListWidget(Widget):
         self.on_text = config.options.get("on_text")
         self.off_text = config.options.get("off_text")
         self.title = config.options.get("title")
+        # Normalized (entity_id, label) rows; entries may be bare entity IDs
+        self._rows: list[tuple[str, str | None]] = [
+            (e[0], e[1] if len(e) > 1 else None) if isinstance(e, list | tuple) else (e, None)
+            for e in self.entities
+        ]
+        self._entity_ids = [entity_id for entity_id, _ in self._rows]
 
     def get_entities(self) -> list[str]:
         """Return list of entity IDs this widget depends on."""
-        return [e[0] if isinstance(e, list | tuple) else e for e in self.entities]
+        return self._entity_ids
 
     def render(
         self,
@@ -169,15 +175,11 @@ class StatusListWidget(Widget):
         max_len = estimate_max_chars(ctx.width, char_width=7, padding=30)
 
         # Draw each entity
-        for entry in self.entities:
-            if isinstance(entry, list | tuple):
-                entity_id, label = entry[0], entry[1]
-            else:
-                entity_id = entry
-                label = None
-
+        states = hass.states if hass else None
+        for entity_id, row_label in self._rows:
             # Get state
-            state = hass.states.get(entity_id) if hass else None
+            state = states.get(entity_id) if states is not None else None
+            label = row_label
 
             # Use helper for state checking
             is_on = is_entity_on(state)
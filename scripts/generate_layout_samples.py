@@ -6,6 +6,7 @@ from __future__ import annotations
 import random
 import sys
 from pathlib import Path
+from typing import Any
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -39,17 +40,19 @@ from custom_components.geekmagic.widgets import (
     StatusListWidget,
     StatusWidget,
     WeatherWidget,
+    Widget,
     WidgetConfig,
 )
 from custom_components.geekmagic.widgets.theme import THEMES
 from scripts.mock_hass import MockHass
+from scripts.sample_output import PNG_COMPRESS_LEVEL
 
 
 def save_layout(renderer: Renderer, img: Image.Image, name: str, output_dir: Path) -> None:
     """Save layout image."""
     final = renderer.finalize(img)
     output_path = output_dir / f"layout_{name}.png"
-    final.save(output_path)
+    final.save(output_path, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
     print(f"Generated: {output_path}")
 
 
@@ -95,9 +98,8 @@ def create_mock_hass() -> MockHass:
     return hass
 
 
-def generate_grid_2x2(renderer: Renderer, output_dir: Path) -> None:
+def generate_grid_2x2(renderer: Renderer, hass: MockHass, output_dir: Path) -> None:
     """Generate Grid 2x2 layout sample - Home Overview."""
-    hass = create_mock_hass()
     # Add more states for this sample
     hass.states.set(
         "climate.living_room",
@@ -107,7 +109,7 @@ def generate_grid_2x2(renderer: Renderer, output_dir: Path) -> None:
     hass.states.set("light.living_room", "on", {"brightness": 200, "friendly_name": "Lights"})
 
     layout = Grid2x2(padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Mixed widgets: Clock, Temperature, Weather, Lights
     widgets = [
@@ -155,9 +157,8 @@ def generate_grid_2x2(renderer: Renderer, output_dir: Path) -> None:
     save_layout(renderer, img, "grid_2x2", output_dir)
 
 
-def generate_grid_2x3(renderer: Renderer, output_dir: Path) -> None:
+def generate_grid_2x3(renderer: Renderer, hass: MockHass, output_dir: Path) -> None:
     """Generate Grid 2x3 layout sample - Smart Home Dashboard."""
-    hass = create_mock_hass()
     # Add smart home entities
     hass.states.set("light.bedroom", "off", {"friendly_name": "Bedroom"})
     hass.states.set("light.kitchen", "on", {"brightness": 255, "friendly_name": "Kitchen"})
@@ -167,7 +168,7 @@ def generate_grid_2x3(renderer: Renderer, output_dir: Path) -> None:
     )
 
     layout = Grid2x3(padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Smart home mix: Lights, Climate, Security
     widgets = [
@@ -238,9 +239,8 @@ def generate_grid_2x3(renderer: Renderer, output_dir: Path) -> None:
     save_layout(renderer, img, "grid_2x3", output_dir)
 
 
-def generate_grid_3x2(renderer: Renderer, output_dir: Path) -> None:
+def generate_grid_3x2(renderer: Renderer, hass: MockHass, output_dir: Path) -> None:
     """Generate Grid 3x2 layout sample - Energy Monitor."""
-    hass = create_mock_hass()
     # Add energy entities
     hass.states.set(
         "sensor.grid_import",
@@ -259,7 +259,7 @@ def generate_grid_3x2(renderer: Renderer, output_dir: Path) -> None:
     )
 
     layout = Grid3x2(padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Energy monitoring: Solar, Battery, Grid, Power usage
     widgets = [
@@ -335,9 +335,8 @@ def generate_grid_3x2(renderer: Renderer, output_dir: Path) -> None:
     save_layout(renderer, img, "grid_3x2", output_dir)
 
 
-def generate_grid_3x3(renderer: Renderer, output_dir: Path) -> None:
+def generate_grid_3x3(renderer: Renderer, hass: MockHass, output_dir: Path) -> None:
     """Generate Grid 3x3 layout sample."""
-    hass = create_mock_hass()
     # Add more sensors for 9 slots
     hass.states.set("sensor.s1", "21", {"unit_of_measurement": "°C", "friendly_name": "Living"})
     hass.states.set("sensor.s2", "19", {"unit_of_measurement": "°C", "friendly_name": "Bedroom"})
@@ -350,7 +349,7 @@ def generate_grid_3x3(renderer: Renderer, output_dir: Path) -> None:
     hass.states.set("sensor.s9", "22", {"unit_of_measurement": "°C", "friendly_name": "Patio"})
 
     layout = Grid3x3(padding=6, gap=6)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     colors = [
         COLOR_ORANGE,
@@ -379,11 +378,10 @@ def generate_grid_3x3(renderer: Renderer, output_dir: Path) -> None:
     save_layout(renderer, img, "grid_3x3", output_dir)
 
 
-def generate_hero(renderer: Renderer, output_dir: Path) -> None:
+def generate_hero(renderer: Renderer, hass: MockHass, output_dir: Path) -> None:
     """Generate Hero layout sample."""
-    hass = create_mock_hass()
     layout = HeroLayout(footer_slots=3, hero_ratio=0.7, padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Weather as hero
     weather = WeatherWidget(
@@ -419,11 +417,10 @@ def generate_hero(renderer: Renderer, output_dir: Path) -> None:
     save_layout(renderer, img, "hero", output_dir)
 
 
-def generate_split_horizontal(renderer: Renderer, output_dir: Path) -> None:
+def generate_split_horizontal(renderer: Renderer, hass: MockHass, output_dir: Path) -> None:
     """Generate Split Horizontal layout sample (side by side)."""
-    hass = create_mock_hass()
     layout = SplitHorizontal(ratio=0.5, padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Clock on left
     clock = ClockWidget(
@@ -448,11 +445,10 @@ def generate_split_horizontal(renderer: Renderer, output_dir: Path) -> None:
     save_layout(renderer, img, "split_horizontal", output_dir)
 
 
-def generate_split_vertical(renderer: Renderer, output_dir: Path) -> None:
+def generate_split_vertical(renderer: Renderer, hass: MockHass, output_dir: Path) -> None:
     """Generate Split Vertical layout sample (stacked)."""
-    hass = create_mock_hass()
     layout = SplitVertical(ratio=0.5, padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Clock on top
     clock = ClockWidget(
@@ -484,9 +480,8 @@ def generate_split_vertical(renderer: Renderer, output_dir: Path) -> None:
     save_layout(renderer, img, "split_vertical", output_dir)
 
 
-def generate_three_column(renderer: Renderer, output_dir: Path) -> None:
+def generate_three_column(renderer: Renderer, hass: MockHass, output_dir: Path) -> None:
     """Generate Three Column layout sample - Fitness Tracker."""
-    hass = create_mock_hass()
     # Add fitness entities
     hass.states.set(
         "sensor.steps", "8542", {"unit_of_measurement": "steps", "friendly_name": "Steps"}
@@ -499,7 +494,7 @@ def generate_three_column(renderer: Renderer, output_dir: Path) -> None:
     )
 
     layout = ThreeColumnLayout(ratios=(0.33, 0.34, 0.33), padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Fitness: Steps, Calories, Heart Rate
     widgets = [
@@ -541,10 +536,92 @@ def generate_three_column(renderer: Renderer, output_dir: Path) -> None:
     save_layout(renderer, img, "three_column", output_dir)
 
 
-def generate_theme_samples(renderer: Renderer, output_dir: Path) -> None:
+# Widget configurations for each theme sample: (widget_type, entity_id, label, options)
+THEME_CONFIGS: dict[str, tuple[tuple[str, str, str, dict[str, Any]], ...]] = {
+    # Classic: Gauge rings + chart (system monitoring feel)
+    "classic": (
+        ("gauge", "sensor.cpu", "CPU", {"style": "ring"}),
+        ("gauge", "sensor.memory", "Memory", {"style": "ring"}),
+        ("chart", "sensor.temperature", "Temp", {"hours": 24}),
+        ("gauge", "sensor.disk", "Disk", {"style": "bar"}),
+    ),
+    # Minimal: Clean entities + status
+    "minimal": (
+        ("entity", "sensor.temp", "Temp", {}),
+        ("entity", "sensor.humidity", "Humidity", {}),
+        ("status", "device_tracker.phone", "Phone", {}),
+        ("entity", "sensor.power", "Power", {}),
+    ),
+    # Neon: Gauges with glow effect
+    "neon": (
+        ("gauge", "sensor.cpu", "CPU", {"style": "arc"}),
+        ("gauge", "sensor.memory", "MEM", {"style": "arc"}),
+        ("chart", "sensor.temperature", "Temp", {"hours": 12}),
+        ("gauge", "sensor.battery", "BAT", {"style": "ring"}),
+    ),
+    # Retro: Terminal-style with bars
+    "retro": (
+        ("gauge", "sensor.cpu", "CPU", {"style": "bar"}),
+        ("gauge", "sensor.memory", "MEM", {"style": "bar"}),
+        ("gauge", "sensor.disk", "DSK", {"style": "bar"}),
+        ("gauge", "sensor.network", "NET", {"style": "bar"}),
+    ),
+    # Soft: Gentle progress + entities
+    "soft": (
+        ("entity", "sensor.temp", "Inside", {}),
+        ("progress", "sensor.battery", "Battery", {"goal": 100}),
+        ("chart", "sensor.temperature", "Trend", {"hours": 24}),
+        ("entity", "sensor.humidity", "Humidity", {}),
+    ),
+    # Light: Clean gauges for daytime use
+    "light": (
+        ("gauge", "sensor.cpu", "CPU", {"style": "ring"}),
+        ("gauge", "sensor.memory", "Memory", {"style": "ring"}),
+        ("entity", "sensor.temp", "Temp", {}),
+        ("progress", "sensor.disk", "Disk", {"goal": 100}),
+    ),
+    # Ocean: Water/nautical themed
+    "ocean": (
+        ("gauge", "sensor.humidity", "Humidity", {"style": "arc"}),
+        ("chart", "sensor.temperature", "Temp", {"hours": 24}),
+        ("entity", "sensor.temp", "Inside", {}),
+        ("gauge", "sensor.battery", "Battery", {"style": "ring"}),
+    ),
+    # Sunset: Warm energy monitoring
+    "sunset": (
+        ("gauge", "sensor.power", "Power", {"style": "arc"}),
+        ("gauge", "sensor.solar", "Solar", {"style": "arc"}),
+        ("chart", "sensor.temperature", "Temp", {"hours": 12}),
+        ("entity", "sensor.battery", "Battery", {}),
+    ),
+    # Forest: Nature/eco themed
+    "forest": (
+        ("entity", "sensor.temp", "Outdoor", {}),
+        ("gauge", "sensor.humidity", "Humidity", {"style": "bar"}),
+        ("chart", "sensor.temperature", "Climate", {"hours": 24}),
+        ("progress", "sensor.solar", "Solar", {"goal": 5}),
+    ),
+    # Candy: Playful and fun
+    "candy": (
+        ("gauge", "sensor.battery", "Battery", {"style": "ring"}),
+        ("entity", "sensor.temp", "Temp", {}),
+        ("progress", "sensor.cpu", "CPU", {"goal": 100}),
+        ("chart", "sensor.temperature", "Trend", {"hours": 12}),
+    ),
+}
+
+# Widget classes used by the theme samples
+THEME_WIDGET_CLASSES: dict[str, type[Widget]] = {
+    "gauge": GaugeWidget,
+    "entity": EntityWidget,
+    "chart": ChartWidget,
+    "progress": ProgressWidget,
+    "status": StatusWidget,
+}
+
+
+def generate_theme_samples(renderer: Renderer, hass: MockHass, output_dir: Path) -> None:
     """Generate sample images for each theme with varied widgets."""
-    hass = create_mock_hass()
-
     # Add chart data for chart widgets
     hass.states.set(
         "sensor.temperature",
@@ -552,157 +629,50 @@ def generate_theme_samples(renderer: Renderer, output_dir: Path) -> None:
         {"unit_of_measurement": "°C", "friendly_name": "Temperature"},
     )
 
-    # Define unique widget configurations for each theme
-    theme_configs: dict[str, list] = {
-        # Classic: Gauge rings + chart (system monitoring feel)
-        "classic": [
-            ("gauge", "sensor.cpu", "CPU", {"style": "ring"}),
-            ("gauge", "sensor.memory", "Memory", {"style": "ring"}),
-            ("chart", "sensor.temperature", "Temp", {"hours": 24}),
-            ("gauge", "sensor.disk", "Disk", {"style": "bar"}),
-        ],
-        # Minimal: Clean entities + status
-        "minimal": [
-            ("entity", "sensor.temp", "Temp", {}),
-            ("entity", "sensor.humidity", "Humidity", {}),
-            ("status", "device_tracker.phone", "Phone", {}),
-            ("entity", "sensor.power", "Power", {}),
-        ],
-        # Neon: Gauges with glow effect
-        "neon": [
-            ("gauge", "sensor.cpu", "CPU", {"style": "arc"}),
-            ("gauge", "sensor.memory", "MEM", {"style": "arc"}),
-            ("chart", "sensor.temperature", "Temp", {"hours": 12}),
-            ("gauge", "sensor.battery", "BAT", {"style": "ring"}),
-        ],
-        # Retro: Terminal-style with bars
-        "retro": [
-            ("gauge", "sensor.cpu", "CPU", {"style": "bar"}),
-            ("gauge", "sensor.memory", "MEM", {"style": "bar"}),
-            ("gauge", "sensor.disk", "DSK", {"style": "bar"}),
-            ("gauge", "sensor.network", "NET", {"style": "bar"}),
-        ],
-        # Soft: Gentle progress + entities
-        "soft": [
-            ("entity", "sensor.temp", "Inside", {}),
-            ("progress", "sensor.battery", "Battery", {"goal": 100}),
-            ("chart", "sensor.temperature", "Trend", {"hours": 24}),
-            ("entity", "sensor.humidity", "Humidity", {}),
-        ],
-        # Light: Clean gauges for daytime use
-        "light": [
-            ("gauge", "sensor.cpu", "CPU", {"style": "ring"}),
-            ("gauge", "sensor.memory", "Memory", {"style": "ring"}),
-            ("entity", "sensor.temp", "Temp", {}),
-            ("progress", "sensor.disk", "Disk", {"goal": 100}),
-        ],
-        # Ocean: Water/nautical themed
-        "ocean": [
-            ("gauge", "sensor.humidity", "Humidity", {"style": "arc"}),
-            ("chart", "sensor.temperature", "Temp", {"hours": 24}),
-            ("entity", "sensor.temp", "Inside", {}),
-            ("gauge", "sensor.battery", "Battery", {"style": "ring"}),
-        ],
-        # Sunset: Warm energy monitoring
-        "sunset": [
-            ("gauge", "sensor.power", "Power", {"style": "arc"}),
-            ("gauge", "sensor.solar", "Solar", {"style": "arc"}),
-            ("chart", "sensor.temperature", "Temp", {"hours": 12}),
-            ("entity", "sensor.battery", "Battery", {}),
-        ],
-        # Forest: Nature/eco themed
-        "forest": [
-            ("entity", "sensor.temp", "Outdoor", {}),
-            ("gauge", "sensor.humidity", "Humidity", {"style": "bar"}),
-            ("chart", "sensor.temperature", "Climate", {"hours": 24}),
-            ("progress", "sensor.solar", "Solar", {"goal": 5}),
-        ],
-        # Candy: Playful and fun
-        "candy": [
-            ("gauge", "sensor.battery", "Battery", {"style": "ring"}),
-            ("entity", "sensor.temp", "Temp", {}),
-            ("progress", "sensor.cpu", "CPU", {"goal": 100}),
-            ("chart", "sensor.temperature", "Trend", {"hours": 12}),
-        ],
-    }
+    # Sample chart history depends only on the slot, so build it once per slot
+    # (deterministic for reproducible samples)
+    chart_histories = []
+    for i in range(4):
+        rng = random.Random(42 + i)  # noqa: S311
+        base_temp = 20
+        chart_histories.append([base_temp + rng.uniform(-3, 5) for _ in range(48)])
 
     for theme_name, theme in THEMES.items():
         layout = Grid2x2(padding=8, gap=8)
         layout.theme = theme
 
         accent_colors = theme.accent_colors
-        configs = theme_configs.get(theme_name, theme_configs["classic"])
+        configs = THEME_CONFIGS.get(theme_name, THEME_CONFIGS["classic"])
 
-        for i, (widget_type, entity_id, label, options) in enumerate(configs):
+        for i, (widget_type, entity_id, label, base_options) in enumerate(configs):
             color = accent_colors[i % len(accent_colors)]
 
-            if widget_type == "gauge":
-                widget = GaugeWidget(
-                    WidgetConfig(
-                        widget_type="gauge",
-                        slot=i,
-                        entity_id=entity_id,
-                        label=label,
-                        color=color,
-                        options=options,
-                    )
-                )
-            elif widget_type == "entity":
-                widget = EntityWidget(
-                    WidgetConfig(
-                        widget_type="entity",
-                        slot=i,
-                        entity_id=entity_id,
-                        label=label,
-                        color=color,
-                        options={"show_panel": True, **options},
-                    )
-                )
-            elif widget_type == "chart":
-                chart = ChartWidget(
-                    WidgetConfig(
-                        widget_type="chart",
-                        slot=i,
-                        entity_id=entity_id,
-                        label=label,
-                        color=color,
-                        options=options,
-                    )
-                )
-                # Set sample history data for chart (deterministic for reproducible samples)
-                rng = random.Random(42 + i)  # noqa: S311
-                base_temp = 20
-                history = [base_temp + rng.uniform(-3, 5) for _ in range(48)]
-                chart.set_history(history)
-                widget = chart
-            elif widget_type == "progress":
-                widget = ProgressWidget(
-                    WidgetConfig(
-                        widget_type="progress",
-                        slot=i,
-                        entity_id=entity_id,
-                        label=label,
-                        color=color,
-                        options=options,
-                    )
-                )
+            widget_class = THEME_WIDGET_CLASSES.get(widget_type)
+            if widget_class is None:
+                continue
+            if widget_type == "entity":
+                options = {"show_panel": True, **base_options}
             elif widget_type == "status":
-                widget = StatusWidget(
-                    WidgetConfig(
-                        widget_type="status",
-                        slot=i,
-                        entity_id=entity_id,
-                        label=label,
-                        color=color,
-                        options={"on_color": theme.success, "off_color": theme.error},
-                    )
-                )
+                options = {"on_color": theme.success, "off_color": theme.error}
             else:
-                continue
+                options = base_options
+
+            widget = widget_class(
+                WidgetConfig(
+                    widget_type=widget_type,
+                    slot=i,
+                    entity_id=entity_id,
+                    label=label,
+                    color=color,
+                    options=options,
+                )
+            )
+            if isinstance(widget, ChartWidget):
+                widget.set_history(chart_histories[i])
 
             layout.set_widget(i, widget)
 
-        img, draw = renderer.create_canvas(background=theme.background)
+        img, draw = renderer.create_canvas(background=theme.background, reuse=True)
         layout.render(renderer, draw, hass)  # type: ignore[arg-type]
         save_layout(renderer, img, f"theme_{theme_name}", output_dir)
 
@@ -713,23 +683,25 @@ def main() -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     renderer = Renderer()
+    # Shared by all samples; each generator only adds its own extra entities
+    hass = create_mock_hass()
 
     print("Generating layout samples...")
     print()
 
-    generate_grid_2x2(renderer, output_dir)
-    generate_grid_2x3(renderer, output_dir)
-    generate_grid_3x2(renderer, output_dir)
-    generate_grid_3x3(renderer, output_dir)
-    generate_hero(renderer, output_dir)
-    generate_split_vertical(renderer, output_dir)
-    generate_split_horizontal(renderer, output_dir)
-    generate_three_column(renderer, output_dir)
+    generate_grid_2x2(renderer, hass, output_dir)
+    generate_grid_2x3(renderer, hass, output_dir)
+    generate_grid_3x2(renderer, hass, output_dir)
+    generate_grid_3x3(renderer, hass, output_dir)
+    generate_hero(renderer, hass, output_dir)
+    generate_split_vertical(renderer, hass, output_dir)
+    generate_split_horizontal(renderer, hass, output_dir)
+    generate_three_column(renderer, hass, output_dir)
 
     print()
     print("Generating theme samples...")
     print()
-    generate_theme_samples(renderer, output_dir)
+    generate_theme_samples(renderer, hass, output_dir)
 
     print()
     print(f"Done! Generated 8 layout samples + {len(THEMES)} theme samples in {output_dir}")
@@ -57,13 +57,14 @@ from scripts.mock_hass import (
     create_thermostat_states,
     create_weather_states,
 )
+from scripts.sample_output import PNG_COMPRESS_LEVEL
 
 
 def save_image(renderer: Renderer, img: Image.Image, name: str, output_dir: Path) -> None:
     """Save the rendered image to disk."""
     final = renderer.finalize(img)
     output_path = output_dir / f"{name}.png"
-    final.save(output_path)
+    final.save(output_path, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
     print(f"Generated: {output_path}")
 
 
@@ -280,7 +281,7 @@ def generate_widget_sizes(renderer: Renderer, output_dir: Path) -> None:
 
     for widget_name, make_widget in widget_types:
         for layout_suffix, layout_class, num_slots, padding, gap in layouts:
-            img, draw = renderer.create_canvas()
+            img, draw = renderer.create_canvas(reuse=True)
 
             if layout_suffix == "1x1":
                 # Single widget using hero layout with minimal footer
@@ -309,7 +310,7 @@ def generate_system_monitor(renderer: Renderer, output_dir: Path) -> None:
     create_system_monitor_states(hass)
 
     layout = Grid2x2(padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # CPU gauge (slot 0 - top left)
     cpu_widget = GaugeWidget(
@@ -373,7 +374,7 @@ def generate_smart_home(renderer: Renderer, output_dir: Path) -> None:
     create_smart_home_states(hass)
 
     layout = Grid2x3(padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Row 1: Device status widgets
     # Living Room Light (slot 0)
@@ -463,7 +464,7 @@ def generate_weather(renderer: Renderer, output_dir: Path) -> None:
     create_weather_states(hass)
 
     layout = HeroLayout(footer_slots=3, hero_ratio=0.75, padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Hero: Weather widget with forecast
     weather = WeatherWidget(
@@ -490,7 +491,7 @@ def generate_server_stats(renderer: Renderer, output_dir: Path) -> None:
 
     # Use 2x3 grid for better spacing (6 widgets instead of 9)
     layout = Grid2x3(padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Row 1: CPU, Memory, Disk
     cpu = GaugeWidget(
@@ -575,7 +576,7 @@ def generate_media_player(renderer: Renderer, output_dir: Path) -> None:
     hass = MockHass()
     create_media_player_states(hass)
 
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Media widget takes full screen
     media = MediaWidget(
@@ -602,7 +603,7 @@ def generate_energy_monitor(renderer: Renderer, output_dir: Path) -> None:
     create_energy_states(hass)
 
     layout = Grid2x2(padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Consumption (slot 0)
     consumption = EntityWidget(
@@ -666,7 +667,7 @@ def generate_fitness(renderer: Renderer, output_dir: Path) -> None:
     create_fitness_states(hass)
 
     layout = HeroLayout(footer_slots=3, hero_ratio=0.7, padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Hero: Multi-progress for activity rings replacement
     progress = MultiProgressWidget(
@@ -752,7 +753,7 @@ def generate_clock_dashboard(renderer: Renderer, output_dir: Path) -> None:
     create_clock_states(hass)
 
     layout = HeroLayout(footer_slots=2, hero_ratio=0.7, padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Hero: Clock widget
     clock = ClockWidget(
@@ -798,7 +799,7 @@ def generate_network_monitor(renderer: Renderer, output_dir: Path) -> None:
     create_network_states(hass)
 
     layout = HeroLayout(footer_slots=3, hero_ratio=0.7, padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Hero: Device status list
     devices = StatusListWidget(
@@ -866,7 +867,7 @@ def generate_thermostat(renderer: Renderer, output_dir: Path) -> None:
     create_thermostat_states(hass)
 
     layout = HeroLayout(footer_slots=3, hero_ratio=0.7, padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Hero: Temperature gauge (using arc style for thermostat look)
     # Read from "temperature" attribute since climate entity state is HVAC mode
@@ -932,7 +933,7 @@ def generate_batteries(renderer: Renderer, output_dir: Path) -> None:
     create_battery_states(hass)
 
     layout = Grid2x2(padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Phone battery
     phone = GaugeWidget(
@@ -996,7 +997,7 @@ def generate_security(renderer: Renderer, output_dir: Path) -> None:
     create_security_states(hass)
 
     layout = SplitVertical(ratio=0.5, padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Top: Door status list
     doors = StatusListWidget(
@@ -1056,7 +1057,7 @@ def generate_welcome_screen(renderer: Renderer, output_dir: Path) -> None:
     hass = MockHass()
 
     layout = HeroLayout(footer_slots=3, hero_ratio=0.65, padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Hero: Clock widget showing current time
     clock = ClockWidget(
@@ -1135,7 +1136,7 @@ def generate_charts_dashboard(renderer: Renderer, output_dir: Path) -> None:
     hass.states.set("binary_sensor.door", "off", {"friendly_name": "Door"})
 
     layout = Grid2x2(padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Temperature chart (numeric)
     temp_chart = ChartWidget(
@@ -1208,7 +1209,7 @@ def generate_gauge_sizes_2x2(renderer: Renderer, output_dir: Path) -> None:
     hass.states.set("sensor.net", "82", {"unit_of_measurement": "%", "friendly_name": "Network"})
 
     layout = Grid2x2(padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     widgets = [
         ("sensor.cpu", "CPU", "cpu", COLOR_LIME),
@@ -1245,7 +1246,7 @@ def generate_gauge_sizes_2x3(renderer: Renderer, output_dir: Path) -> None:
     hass.states.set("sensor.swap", "30", {"unit_of_measurement": "%", "friendly_name": "Swap"})
 
     layout = Grid2x3(padding=8, gap=8)
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     widgets = [
         ("sensor.cpu", "CPU", "cpu", COLOR_LIME),
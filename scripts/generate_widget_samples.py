@@ -43,6 +43,7 @@ from custom_components.geekmagic.widgets import (
     WidgetConfig,
 )
 from scripts.mock_hass import MockHass
+from scripts.sample_output import PNG_COMPRESS_LEVEL
 
 
 def render_widget_sample(
@@ -65,7 +66,7 @@ def render_widget_sample(
         Cropped and finalized widget image
     """
     # Create full canvas
-    img, draw = renderer.create_canvas()
+    img, draw = renderer.create_canvas(reuse=True)
 
     # Calculate centered position for widget (in unscaled coordinates)
     # This ensures the widget renders properly with relative sizing
@@ -87,7 +88,7 @@ def render_widget_sample(
 def save_widget(img: Image.Image, name: str, output_dir: Path) -> None:
     """Save widget image."""
     output_path = output_dir / f"widget_{name}.png"
-    img.save(output_path)
+    img.save(output_path, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
     print(f"Generated: {output_path}")
 
 
@@ -0,0 +1,9 @@
+"""Shared output settings for the sample generation scripts."""
+
+from __future__ import annotations
+
+import os
+
+# zlib level 6 keeps the PNGs committed under samples/ small; set
+# GEEKMAGIC_SAMPLES_FAST=1 for faster saves while iterating locally
+PNG_COMPRESS_LEVEL = 1 if os.environ.get("GEEKMAGIC_SAMPLES_FAST") == "1" else 6
@@ -0,0 +1,36 @@
+"""Tests for GeekMagic select entities."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.geekmagic.entities.select import GeekMagicCurrentViewSelect
+from custom_components.geekmagic.store import GeekMagicStore
+
+
+class TestCurrentViewSelect:
+    """Tests for the current view select's cached options."""
+
+    @pytest.mark.asyncio
+    async def test_options_follow_renames_and_assignments(self, hass):
+        """Test cached view names refresh on store edits and reassignment."""
+        store = GeekMagicStore(hass)
+        living = await store.async_create_view("Living Room")
+        kitchen = await store.async_create_view("Kitchen")
+
+        coordinator = MagicMock()
+        coordinator.entry.entry_id = "test_entry_123"
+        coordinator.entry.title = "Test Display"
+        coordinator.options = {"assigned_views": [living]}
+        coordinator.get_store.return_value = store
+
+        select = GeekMagicCurrentViewSelect(coordinator)
+        select.async_write_ha_state = MagicMock()
+        store.async_add_listener(select._handle_store_update)
+        assert select.options == ["Living Room"]
+
+        await store.async_update_view(living, name="Lounge")
+        assert select.options == ["Lounge"]
+
+        coordinator.options = {"assigned_views": [living, kitchen]}
+        assert select.options == ["Lounge", "Kitchen"]
@@ -71,6 +71,17 @@ class TestGridLayout:
         layout = GridLayout(rows=3, cols=3)
         assert layout.get_slot_count() == 9
 
+    def test_cached_slots_match_fresh_calculation(self):
+        """Test that a second layout with the same geometry gets equal, unshared slots."""
+        first = GridLayout(rows=2, cols=3, padding=4)
+        second = GridLayout(rows=2, cols=3, padding=4)
+        assert [s.rect for s in second.slots] == [s.rect for s in first.slots]
+        assert [s.index for s in second.slots] == list(range(6))
+        assert second.slots[0] is not first.slots[0]
+
+        other = GridLayout(rows=2, cols=3, padding=12)
+        assert other.slots[0].rect != first.slots[0].rect
+
     def test_slot_rectangles_valid(self):
         """Test that slot rectangles are valid (x2 > x1, y2 > y1)."""
         layout = GridLayout(rows=2, cols=2)
@@ -109,6 +120,20 @@ class TestGridLayout:
         layout.set_widget(0, widget)
         assert layout.slots[0].widget is widget
 
+    def test_get_widgets_of_type(self):
+        """Test widget type index follows slot replacement."""
+        layout = GridLayout(rows=2, cols=2)
+        first = ClockWidget(WidgetConfig(widget_type="clock", slot=0))
+        second = ClockWidget(WidgetConfig(widget_type="clock", slot=1))
+
+        layout.set_widget(0, first)
+        layout.set_widget(1, second)
+        assert layout.get_widgets_of_type(ClockWidget) == [first, second]
+
+        replacement = ClockWidget(WidgetConfig(widget_type="clock", slot=0))
+        layout.set_widget(0, replacement)
+        assert layout.get_widgets_of_type(ClockWidget) == [second, replacement]
+
     def test_render(self, renderer, canvas):
         """Test rendering layout with widgets."""
         img, draw = canvas
@@ -268,6 +293,11 @@ class TestThreeColumnLayout:
         layout = ThreeColumnLayout()
         assert layout.get_slot_count() == 3
 
+    def test_columns_fill_width(self):
+        """Test columns cover the full width with no pixels lost to rounding."""
+        layout = ThreeColumnLayout()
+        assert layout.slots[-1].rect[2] == layout.width - layout.padding
+
     def test_custom_ratios(self):
         """Test custom column ratios."""
         layout = ThreeColumnLayout(ratios=(0.25, 0.5, 0.25))
@@ -285,6 +315,14 @@ class TestThreeColumnLayout:
         assert middle_width > left_width
         assert middle_width > right_width
 
+    def test_list_ratios(self):
+        """Test ratios given as a list behave like the equivalent tuple."""
+        layout = ThreeColumnLayout(ratios=[1, 2, 1])
+        expected = ThreeColumnLayout(ratios=(1, 2, 1))
+
+        assert layout.ratios == (1, 2, 1)
+        assert [s.rect for s in layout.slots] == [s.rect for s in expected.slots]
+
     def test_render(self, renderer, canvas):
         """Test rendering three column layout."""
         img, draw = canvas
@@ -100,9 +100,28 @@ class TestCoordinatorMultiScreen:
         coordinator = GeekMagicCoordinator(hass, coordinator_device, new_format_options)
         coordinator.async_request_refresh = AsyncMock()  # type: ignore[method-assign]
 
+        listener = MagicMock()
+        unsub = coordinator.async_add_listener(listener)
+
         await coordinator.async_set_screen(1)
+        unsub()
         assert coordinator.current_screen == 1
         assert coordinator.current_screen_name == "Media"
+        listener.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_set_brightness_is_optimistic(self, hass, coordinator_device, new_format_options):
+        """Test brightness is applied locally without waiting for a poll."""
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, new_format_options)
+        listener = MagicMock()
+        unsub = coordinator.async_add_listener(listener)
+
+        await coordinator.async_set_brightness(40)
+        unsub()
+
+        coordinator_device.set_brightness.assert_awaited_once_with(40)
+        assert coordinator.device_brightness == 40
+        listener.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_set_screen_invalid_index(self, hass, coordinator_device, new_format_options):
@@ -136,6 +155,40 @@ class TestCoordinatorMultiScreen:
         assert coordinator.current_screen == 1  # Wraps around
 
 
+class TestCoordinatorPreviewListeners:
+    """Test preview listeners fire only when the preview is re-rendered."""
+
+    @pytest.mark.asyncio
+    async def test_preview_listener_only_on_preview_update(
+        self, hass, coordinator_device, new_format_options
+    ):
+        """Test listeners skip plain polls and stop after unsubscribing."""
+        coordinator_device.get_brightness = AsyncMock(return_value=50)
+        coordinator_device.get_state = AsyncMock(return_value=None)
+        coordinator_device.get_space = AsyncMock(return_value=None)
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, new_format_options)
+        listener = MagicMock()
+        unsub = coordinator.async_add_preview_listener(listener)
+
+        # First refresh renders the initial preview
+        await coordinator._async_update_data()
+        listener.assert_called_once()
+        assert coordinator.last_image is not None
+
+        # Periodic poll leaves the preview alone
+        await coordinator._async_update_data()
+        listener.assert_called_once()
+
+        coordinator._update_preview = True
+        await coordinator._async_update_data()
+        assert listener.call_count == 2
+
+        unsub()
+        coordinator._update_preview = True
+        await coordinator._async_update_data()
+        assert listener.call_count == 2
+
+
 class TestCoordinatorUpdateOptions:
     """Test options update functionality."""
 
@@ -159,6 +212,41 @@ class TestCoordinatorUpdateOptions:
         assert coordinator.screen_count == 3
 
 
+class TestCoordinatorWelcomeScreen:
+    """Test the welcome screen shown when nothing is configured."""
+
+    def test_welcome_layout_reused_with_live_entity_count(self, hass, coordinator_device):
+        """Test the welcome layout is built once and its entity count refreshed."""
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, {CONF_SCREENS: []})
+
+        coordinator._render_display()
+        layout = coordinator._welcome_layout
+        assert layout is not None
+
+        hass.states.async_set("sensor.new_entity", "1")
+        coordinator._render_display()
+
+        assert coordinator._welcome_layout is layout
+        assert coordinator._welcome_entity_count is not None
+        assert coordinator._welcome_entity_count.text == str(hass.states.async_entity_ids_count())
+
+
+class TestCoordinatorCameraPrefetch:
+    """Test camera snapshot prefetching."""
+
+    @pytest.mark.asyncio
+    async def test_drops_snapshots_for_cameras_off_screen(
+        self, hass, coordinator_device, new_format_options
+    ):
+        """Test cached snapshots are pruned when no camera widget shows them."""
+        coordinator = GeekMagicCoordinator(hass, coordinator_device, new_format_options)
+        coordinator._camera_images["camera.front_door"] = b"jpeg"
+
+        await coordinator._async_fetch_camera_images()
+
+        assert coordinator.get_camera_image("camera.front_door") is None
+
+
 class TestCoordinatorWidgetRegistration:
     """Test that all widget types are registered."""
 
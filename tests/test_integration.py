@@ -1,10 +1,12 @@
 """Integration tests for GeekMagic."""
 
+import asyncio
 import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.exceptions import ConfigEntryNotReady
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -45,6 +47,24 @@ class TestIntegrationSetup:
                 assert result is False
                 mock_device.test_connection.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_setup_entry_connection_timeout(self, hass, integration_entry):
+        """Test setup defers to HA retry when the device does not answer in time."""
+        integration_entry.add_to_hass(hass)
+
+        async def _hang():
+            await asyncio.sleep(1)
+
+        with (
+            patch("custom_components.geekmagic.async_get_clientsession"),
+            patch("custom_components.geekmagic.GeekMagicDevice") as mock_device_class,
+            patch("custom_components.geekmagic.SETUP_TIMEOUT", 0.01),
+        ):
+            mock_device_class.return_value.test_connection = _hang
+
+            with pytest.raises(ConfigEntryNotReady):
+                await async_setup_entry(hass, integration_entry)
+
     @pytest.mark.asyncio
     async def test_setup_entry_success(self, hass, integration_entry):
         """Test successful setup creates coordinator and registers services."""
@@ -74,8 +94,7 @@ class TestIntegrationSetup:
                         result = await async_setup_entry(hass, integration_entry)
 
                         assert result is True
-                        assert DOMAIN in hass.data
-                        assert integration_entry.entry_id in hass.data[DOMAIN]
+                        assert integration_entry.runtime_data is mock_coordinator
 
 
 class TestIntegrationUnload:
@@ -94,25 +113,26 @@ class TestIntegrationUnload:
 
     @pytest.mark.asyncio
     async def test_unload_entry_success(self, hass, unload_entry):
-        """Test successful unload removes coordinator."""
+        """Test successful unload."""
         unload_entry.add_to_hass(hass)
-        # Set up the data structure as if setup was called
-        hass.data[DOMAIN] = {unload_entry.entry_id: MagicMock()}
+        # Set up runtime data as if setup was called
+        unload_entry.runtime_data = MagicMock()
 
         with patch.object(
             hass.config_entries, "async_unload_platforms", new=AsyncMock(return_value=True)
-        ):
+        ) as mock_unload:
             result = await async_unload_entry(hass, unload_entry)
 
             assert result is True
-            assert unload_entry.entry_id not in hass.data[DOMAIN]
+            mock_unload.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_unload_entry_failure(self, hass, unload_entry):
         """Test failed unload keeps coordinator."""
         unload_entry.add_to_hass(hass)
-        # Set up the data structure as if setup was called
-        hass.data[DOMAIN] = {unload_entry.entry_id: MagicMock()}
+        # Set up runtime data as if setup was called
+        coordinator = MagicMock()
+        unload_entry.runtime_data = coordinator
 
         with patch.object(
             hass.config_entries, "async_unload_platforms", new=AsyncMock(return_value=False)
@@ -121,4 +141,4 @@ class TestIntegrationUnload:
 
             assert result is False
             # Coordinator should still be present on failure
-            assert unload_entry.entry_id in hass.data[DOMAIN]
+            assert unload_entry.runtime_data is coordinator
@@ -29,6 +29,10 @@ class TestRenderer:
         assert renderer.font_regular is not None
         assert renderer.font_large is not None
 
+    def test_fonts_shared_between_instances(self):
+        """Test fonts are loaded once and reused by later renderers."""
+        assert Renderer().font_regular is Renderer().font_regular
+
     def test_create_canvas_default(self):
         """Test creating canvas with default black background."""
         renderer = Renderer()
@@ -42,6 +46,18 @@ class TestRenderer:
         # Check that background is black
         assert img.getpixel((0, 0)) == COLOR_BLACK
 
+    def test_create_canvas_reuse_clears_previous_frame(self):
+        """Test reused canvas is the same image, cleared to the new background."""
+        renderer = Renderer()
+        img, draw = renderer.create_canvas(reuse=True)
+        draw.rectangle((0, 0, 20, 20), fill=COLOR_WHITE)
+
+        img2, _ = renderer.create_canvas(background=COLOR_CYAN, reuse=True)
+
+        assert img2 is img
+        assert img2.getpixel((10, 10)) == COLOR_CYAN
+        assert renderer.create_canvas()[0] is not img
+
     def test_create_canvas_custom_background(self):
         """Test creating canvas with custom background color."""
         renderer = Renderer()
@@ -80,6 +96,28 @@ class TestRenderer:
         final = renderer.finalize(img)
         assert final.size == (DISPLAY_WIDTH, DISPLAY_HEIGHT)
 
+    def test_draw_text_matches_pillow_text(self):
+        """Test cached text masks draw the same pixels as ImageDraw.text."""
+        renderer = Renderer()
+
+        for anchor in (None, "mm", "ls", "rb"):
+            expected, expected_draw = renderer.create_canvas()
+            expected_draw.text(
+                (120, 80), "Jy 23.5°", font=renderer.font_large, fill=COLOR_CYAN, anchor=anchor
+            )
+
+            for _ in range(2):  # second draw comes from the mask cache
+                img, draw = renderer.create_canvas()
+                renderer.draw_text(
+                    draw,
+                    "Jy 23.5°",
+                    (60, 40),
+                    font=renderer.font_large,
+                    color=COLOR_CYAN,
+                    anchor=anchor,
+                )
+                assert img.tobytes() == expected.tobytes()
+
     def test_draw_rect(self):
         """Test drawing rectangles."""
         renderer = Renderer()
@@ -301,6 +339,45 @@ class TestRenderer:
         # Higher quality should produce larger file for complex images
         assert len(high_quality) > len(low_quality)
 
+    def test_to_jpeg_reduces_quality_to_fit_max_size(self):
+        """Test oversized output is re-encoded at lower quality until it fits."""
+        renderer = Renderer()
+        img, draw = renderer.create_canvas()
+        for i in range(0, 480, 3):
+            draw.line((i, 0, 480 - i, 480), fill=(i % 256, (i * 7) % 256, (i * 13) % 256))
+
+        full = renderer.to_jpeg(img, quality=95, max_size=10**9)
+        capped = renderer.to_jpeg(img, quality=95, max_size=len(full) - 1)
+
+        assert len(capped) < len(full)
+        assert capped[:2] == b"\xff\xd8"
+        assert capped[-2:] == b"\xff\xd9"
+
+    def test_unchanged_frame_reuses_encoded_bytes(self):
+        """Test an identical frame is not re-encoded, but a changed one is."""
+        renderer = Renderer()
+        img, draw = renderer.create_canvas()
+
+        first_png = renderer.to_png(img)
+        first_jpeg = renderer.to_jpeg(img)
+        assert renderer.to_png(img) is first_png
+        assert renderer.to_jpeg(img) is first_jpeg
+
+        draw.rectangle((0, 0, 100, 100), fill=(255, 0, 0))
+        assert renderer.to_png(img) != first_png
+        assert renderer.to_jpeg(img) != first_jpeg
+
+    def test_to_jpeg_and_png_matches_separate_encodes(self):
+        """Test the combined encode produces the same bytes as to_jpeg and to_png."""
+        renderer = Renderer()
+        img, draw = renderer.create_canvas()
+        draw.ellipse((40, 40, 300, 300), fill=(0, 128, 255))
+
+        jpeg_bytes, png_bytes = renderer.to_jpeg_and_png(img)
+
+        assert jpeg_bytes == Renderer().to_jpeg(img)
+        assert png_bytes == Renderer().to_png(img)
+
     def test_to_jpeg_default_quality_is_high(self):
         """Test that default JPEG quality is high (92)."""
         from custom_components.geekmagic.const import DEFAULT_JPEG_QUALITY
@@ -0,0 +1,61 @@
+"""Tests for the GeekMagic global view store."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.geekmagic.store import SAVE_DELAY, STORAGE_KEY, GeekMagicStore
+
+
+class TestStoreSave:
+    """Test deferred saving of views."""
+
+    @pytest.mark.asyncio
+    async def test_burst_of_saves_coalesces(self, hass, hass_storage, freezer):
+        """Test several edits in a row result in a single disk write."""
+        store = GeekMagicStore(hass)
+        with patch.object(
+            store._store, "_async_write_data", wraps=store._store._async_write_data
+        ) as write:
+            view_id = await store.async_create_view("Living Room")
+            await store.async_update_view(view_id, theme="neon")
+            await store.async_create_view("Kitchen")
+            assert write.call_count == 0
+            assert STORAGE_KEY not in hass_storage
+
+            freezer.tick(timedelta(seconds=SAVE_DELAY + 1))
+            async_fire_time_changed(hass)
+            await hass.async_block_till_done()
+
+            assert write.call_count == 1
+        views = hass_storage[STORAGE_KEY]["data"]["views"]
+        assert len(views) == 2
+        assert views[view_id]["theme"] == "neon"
+
+    @pytest.mark.asyncio
+    async def test_pending_save_flushed_on_final_write(self, hass, hass_storage):
+        """Test a pending save is written when Home Assistant shuts down."""
+        store = GeekMagicStore(hass)
+        view_id = await store.async_create_view("Office")
+        assert STORAGE_KEY not in hass_storage
+
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+
+        assert view_id in hass_storage[STORAGE_KEY]["data"]["views"]
+
+    @pytest.mark.asyncio
+    async def test_save_notifies_listeners_immediately(self, hass):
+        """Test listeners see changes before the deferred write happens."""
+        store = GeekMagicStore(hass)
+        calls = []
+        unsub = store.async_add_listener(lambda: calls.append(len(store.views)))
+
+        await store.async_create_view("Garage")
+        unsub()
+        await store.async_create_view("Attic")
+
+        assert calls == [1]
@@ -0,0 +1,75 @@
+"""Tests for GeekMagic websocket payload validation."""
+
+import pytest
+import voluptuous as vol
+
+from custom_components.geekmagic.const import LAYOUT_GRID_2X2, THEME_CLASSIC
+from custom_components.geekmagic.websocket import (
+    PREVIEW_VIEW_SCHEMA,
+    PREVIEW_WIDGET_SCHEMA,
+    _coerce_color,
+)
+
+
+class TestCoerceColor:
+    """Test _coerce_color."""
+
+    def test_list_to_tuple(self):
+        """Test an RGB list becomes a tuple of ints."""
+        assert _coerce_color([255, 128, 0]) == (255, 128, 0)
+
+    def test_numeric_strings(self):
+        """Test numeric strings are converted to ints."""
+        assert _coerce_color(["10", "20", "30"]) == (10, 20, 30)
+
+    def test_malformed_returns_none(self):
+        """Test malformed colors are ignored."""
+        assert _coerce_color([1, 2]) is None
+        assert _coerce_color("red") is None
+        assert _coerce_color(None) is None
+        assert _coerce_color(["red", "green", "blue"]) is None
+
+
+class TestPreviewSchema:
+    """Test preview payload schemas."""
+
+    def test_view_defaults(self):
+        """Test an empty view gets default layout, theme and widgets."""
+        view = PREVIEW_VIEW_SCHEMA({})
+        assert view["layout"] == LAYOUT_GRID_2X2
+        assert view["theme"] == THEME_CLASSIC
+        assert view["widgets"] == []
+
+    def test_widget_defaults(self):
+        """Test a minimal widget gets slot and options filled in."""
+        widget = PREVIEW_WIDGET_SCHEMA({"type": "clock"})
+        assert widget["slot"] == 0
+        assert widget["options"] == {}
+
+    def test_null_options(self):
+        """Test null options are treated as empty."""
+        widget = PREVIEW_WIDGET_SCHEMA({"type": "clock", "options": None})
+        assert widget["options"] == {}
+
+    def test_invalid_options_rejected(self):
+        """Test non-dict options are still rejected."""
+        with pytest.raises(vol.Invalid):
+            PREVIEW_WIDGET_SCHEMA({"type": "clock", "options": "compact"})
+
+    def test_label_coerced_to_string(self):
+        """Test a non-string label is converted rather than rejected."""
+        widget = PREVIEW_WIDGET_SCHEMA({"type": "text", "label": 42})
+        assert widget["label"] == "42"
+
+    def test_color_coerced(self):
+        """Test colors are coerced and malformed ones ignored."""
+        widget = PREVIEW_WIDGET_SCHEMA({"type": "entity", "color": [1, 2, 3]})
+        assert widget["color"] == (1, 2, 3)
+
+        widget = PREVIEW_WIDGET_SCHEMA({"type": "entity", "color": "not-a-color"})
+        assert widget["color"] is None
+
+    def test_slot_coerced(self):
+        """Test string slots are converted to ints."""
+        view = PREVIEW_VIEW_SCHEMA({"widgets": [{"type": "clock", "slot": "2"}]})
+        assert view["widgets"][0]["slot"] == 2